@@ -5,11 +5,13 @@ from pathlib import Path
 
 from neosca.ns_about import __version__
 
-PKG_DIR: Path = Path(__file__).parent.absolute()
+# __file__ and _MEIPASS are already absolute, so skip the getcwd-backed
+# .absolute() calls at import time
+PKG_DIR: Path = Path(__file__).parent
 # https://stackoverflow.com/a/13790741/20732031
 attr = "_MEIPASS"
 if hasattr(sys, attr):
-    NEOSCA_DIR: Path = Path(getattr(sys, attr)).absolute()
+    NEOSCA_DIR: Path = Path(getattr(sys, attr))
 else:
     NEOSCA_DIR = PKG_DIR.parent.parent
 
@@ -18,15 +20,24 @@ QSS_PATH: Path = DATA_DIR / "styles.qss"
 STANZA_MODEL_DIR: Path = DATA_DIR / "stanza_resources"
 CITING_PATH: Path = DATA_DIR / "citings.json"
 ACKS_PATH: Path = DATA_DIR / "acks.json"
+# Pre-formatted cell HTML generated by utils/ns_generate_acks.py; optional,
+# the acknowledgments dialog falls back to formatting acks.json at runtime
+ACKS_PREBUILT_PATH: Path = DATA_DIR / "acks_prebuilt.json"
 ICON_PATH: Path = DATA_DIR / "ns_icon.ico"
 ICON_MAC_PATH: Path = DATA_DIR / "ns_icon.icns"
 SETTING_PATH: Path = DATA_DIR / "settings.ini"
+# Created on demand by Ns_IO.dump_bytes/dump_json when the first cache file
+# is written
 CACHE_DIR: Path = DATA_DIR / "cache" / "cache"
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
 CACHE_INFO_PATH: Path = DATA_DIR / "cache" / "cache_info.json"
 
-DESKTOP_PATH: Path = Path.home().absolute() / "Desktop"
+# Path.home() is always absolute
+DESKTOP_PATH: Path = Path.home() / "Desktop"
 
-sys.path.insert(0, str(PKG_DIR))
+# Append rather than prepend so stdlib/site-packages lookups stay first, and
+# keep the insert idempotent across re-imports
+_pkg_dir_str = str(PKG_DIR)
+if _pkg_dir_str not in sys.path:
+    sys.path.append(_pkg_dir_str)
 
 __all__ = ["__version__"]
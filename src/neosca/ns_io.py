@@ -9,7 +9,7 @@ import os.path as os_path
 import pickle
 import sys
 import zipfile
-from collections.abc import Generator, Iterable, Sequence
+from collections.abc import Container, Generator, Iterable
 from os import PathLike
 from pathlib import Path
 from typing import Any
@@ -189,8 +189,9 @@ class Ns_IO(metaclass=Ns_IO_Meta):
     def load_json(cls, file_path: str | PathLike) -> Any:
         cls._check_file_extension(file_path, ".json")
 
-        with open(file_path, "rb") as f:
-            return json.load(f)
+        # Read the whole file in one syscall and hand the parser a contiguous
+        # buffer; json.load pulls the file handle in small chunks
+        return json.loads(Path(file_path).read_bytes())
 
     @classmethod
     def dump_json(cls, data: Any, path: str | PathLike) -> None:
@@ -201,14 +202,25 @@ class Ns_IO(metaclass=Ns_IO_Meta):
             Path(path).parent.mkdir(parents=True)
             cls.dump_json(data, path)
 
+    # os.O_BINARY exists only on Windows, where it keeps os.write from
+    # translating newlines
+    DUMP_BYTES_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
     @classmethod
     def dump_bytes(cls, data: bytes, path: str | PathLike) -> None:
+        # The data is written in one shot, so skip open()'s BufferedWriter
+        # layer and hand the bytes straight to the OS
         try:
-            with open(path, "wb") as f:
-                f.write(data)
+            fd = os.open(path, cls.DUMP_BYTES_FLAGS, 0o644)
         except FileNotFoundError:
             Path(path).parent.mkdir(parents=True)
-            cls.dump_bytes(data, path)
+            fd = os.open(path, cls.DUMP_BYTES_FLAGS, 0o644)
+        try:
+            written = 0
+            while written < len(data):
+                written += os.write(fd, data[written:])
+        finally:
+            os.close(fd)
 
     @classmethod
     def get_verified_ifile_list(cls, ifile_list: Iterable[str]) -> list[str]:
@@ -258,7 +270,7 @@ class Ns_IO(metaclass=Ns_IO_Meta):
         return verified_subfiles_list
 
     @classmethod
-    def ensure_unique_filestem(cls, stem: str, existing_stems: Sequence[str]) -> str:
+    def ensure_unique_filestem(cls, stem: str, existing_stems: Container[str]) -> str:
         if stem in existing_stems:
             occurrence = 2
             while f"{stem} ({occurrence})" in existing_stems:
@@ -269,6 +281,7 @@ class Ns_IO(metaclass=Ns_IO_Meta):
 
 class Ns_Cache:
     CACHE_EXTENSION = ".pickle.lzma"
+    FOREST_EXTENSION = ".forest.lzma"
     # fpath_cname: { "/absolute/path/to/foo.txt": "foo.pickle.lzma", ... }
     fpath_cname: dict[str, str] = (
         Ns_IO.load_json(CACHE_INFO_PATH)
@@ -304,6 +317,16 @@ class Ns_Cache:
         logging.info(f"Found cache: {cache_path} exists, and is non-empty and newer than {file_path}.")
         return cache_path, True
 
+    @classmethod
+    def get_forest_path(cls, cache_path: str) -> str:
+        """
+        Sidecar of cache_path holding the plain constituency-tree text, so
+        cache hits that only need trees can skip Document deserialization
+        >>> get_forest_path("/path/to/cache_dir/foo.pickle.lzma")
+        /path/to/cache_dir/foo.forest.lzma
+        """
+        return cache_path.removesuffix(cls.CACHE_EXTENSION) + cls.FOREST_EXTENSION
+
     @classmethod
     def _size_fmt(cls, filesize: int | float, suffix: str = "B") -> str:
         # https://github.com/gaogaotiantian/viztracer/blob/3ecd46aa0e70df7dd78f720a2660d6da211c4a51/src/viztracer/util.py#L12
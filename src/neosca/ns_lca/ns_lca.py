@@ -73,13 +73,22 @@ class Ns_LCA:
         if not self.is_cache:
             cache_path: str | None = None  # type: ignore
 
+        # try/finally instead of "except BaseException ... raise" so that
+        # KeyboardInterrupt both propagates promptly and still triggers the
+        # cleanup of a cache generated at current run, which is potentially broken
+        is_succeeded = False
         try:
-            return self.get_lempos_frm_text(text)
-        except BaseException as e:
-            # If cache is generated at current run, remove it as it is potentially broken
-            if cache_path is not None and os_path.exists(cache_path) and not is_cache_available:
+            lempos = self.get_lempos_frm_text(text)
+            is_succeeded = True
+            return lempos
+        finally:
+            if (
+                not is_succeeded
+                and cache_path is not None
+                and os_path.exists(cache_path)
+                and not is_cache_available
+            ):
                 os.remove(cache_path)
-            raise e
 
     def init_new_counter(self, file_path: str = "") -> Ns_LCA_Counter:
         return Ns_LCA_Counter(
@@ -148,7 +157,12 @@ class Ns_LCA:
             counter.get_all_values(self.precision) for counter in self.counters
         ]
 
-        handle = sys.stdout if self.is_stdout else open(self.ofile_freq, "w", encoding="utf-8", newline="")  # noqa: SIM115
+        # A 1 MiB buffer keeps large result tables from flushing every 8 KiB
+        handle = (
+            sys.stdout
+            if self.is_stdout
+            else open(self.ofile_freq, "w", encoding="utf-8", newline="", buffering=1 << 20)  # noqa: SIM115
+        )
 
         if self.oformat_freq == "csv":
             import csv
@@ -315,20 +315,20 @@ class Ns_LCA_Counter:
         subodir_matched = os_path.join(odir_matched, bn_input_noext).strip()
         if not is_stdout:
             shutil.rmtree(subodir_matched, ignore_errors=True)
-            os.makedirs(subodir_matched)
+            os.makedirs(subodir_matched, exist_ok=True)
+            fn_prefix = os_path.join(subodir_matched, bn_input_noext + "-")
         for item in self.DEFAULT_MEASURES:
             if not (matches := self.get_matches(item)):
                 continue
 
-            res = "\n".join(matches)
             matches_id = f"{bn_input_noext}-{item}"
             if not is_stdout:
-                extension = ".txt"
-                fn_match_output = os_path.join(subodir_matched, matches_id + extension)
-                with open(fn_match_output, "w", encoding="utf-8") as f:
-                    f.write(f"{res}\n")
+                fn_match_output = fn_prefix + item + ".txt"
+                with open(fn_match_output, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    f.writelines(f"{match}\n" for match in matches)
             else:
-                sys.stdout.write(f"{matches_id}\n\n{res}\n")
+                sys.stdout.write(f"{matches_id}\n\n")
+                sys.stdout.writelines(f"{match}\n" for match in matches)
 
     def __add__(self, other: "Ns_LCA_Counter") -> "Ns_LCA_Counter":
         logging.debug("Combining counters...")
@@ -146,6 +146,28 @@ class Ns_Main_Cli:
             action="store_true",
             help="Save the matched subtrees.",
         )
+        sca_parser.add_argument(
+            "--zip-matches",
+            dest="is_zip_matches",
+            default=False,
+            action="store_true",
+            help=(
+                "Save the matched subtrees of each input file into a zip archive instead of"
+                " a directory of text files. Only effective together with --save-matches."
+            ),
+        )
+        sca_parser.add_argument(
+            "--jobs",
+            "-j",
+            metavar="<number>",
+            dest="n_workers",
+            type=int,
+            default=1,
+            help=(
+                "Number of worker processes to query input files in parallel."
+                " The default is 1, which queries files one by one in the main process."
+            ),
+        )
         sca_parser.add_argument(
             "--no-parse",
             dest="is_skip_parsing",
@@ -275,6 +297,9 @@ class Ns_Main_Cli:
             options.is_cache = False
             options.is_use_cache = False
 
+        if options.n_workers < 1:
+            return False, f"The number of jobs ({options.n_workers}) should be at least 1."
+
         if options.text is not None:
             logging.debug(f"CLI text: {options.text}")
 
@@ -329,9 +354,11 @@ class Ns_Main_Cli:
             "is_cache": options.is_cache,
             "is_use_cache": options.is_use_cache,
             "is_save_matches": options.is_save_matches,
+            "is_zip_matches": options.is_zip_matches,
             "is_stdout": options.is_stdout,
             "is_skip_parsing": options.is_skip_parsing,
             "config": user_config,
+            "n_workers": options.n_workers,
         }
         return True, None
 
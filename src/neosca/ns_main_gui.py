@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import functools
 import os
 import os.path as os_path
 import re
@@ -31,22 +32,15 @@ from neosca.ns_lca.ns_lca_counter import Ns_LCA_Counter
 from neosca.ns_platform_info import IS_MAC
 from neosca.ns_qss import Ns_QSS
 from neosca.ns_sca.ns_sca_counter import Ns_SCA_Counter
-from neosca.ns_settings.ns_dialog_settings import Ns_Dialog_Settings
 from neosca.ns_settings.ns_settings import Ns_Settings
 from neosca.ns_settings.ns_settings_default import DEFAULT_FONT_SIZE, available_import_types
 from neosca.ns_threads import Ns_Thread, Ns_Worker_LCA_Generate_Table, Ns_Worker_SCA_Generate_Table
 from neosca.ns_widgets.ns_buttons import Ns_PushButton
 from neosca.ns_widgets.ns_delegates import Ns_StyledItemDelegate_File, Ns_StyledItemDelegate_Matches
-from neosca.ns_widgets.ns_dialogs import (
-    Ns_Dialog_About,
-    Ns_Dialog_Processing_With_Elapsed_Time,
-    Ns_Dialog_Table,
-    Ns_Dialog_Table_Acknowledgments,
-    Ns_Dialog_Table_Cache,
-    Ns_Dialog_Table_Subfiles,
-    Ns_Dialog_TextEdit_Citing,
-    Ns_Dialog_TextEdit_Err,
-)
+
+# Dialogs used only from menu handlers are imported inside the handler that
+# first needs them, to keep them off the startup path
+from neosca.ns_widgets.ns_dialogs import Ns_Dialog_Processing_With_Elapsed_Time, Ns_Dialog_TextEdit_Err
 from neosca.ns_widgets.ns_tables import (
     Ns_SortFilterProxyModel,
     Ns_StandardItemModel,
@@ -55,6 +49,9 @@ from neosca.ns_widgets.ns_tables import (
 )
 from neosca.ns_widgets.ns_widgets import Ns_MessageBox_Question
 
+# "150%" -> ".50", i.e. a QT_SCALE_FACTOR of 1.50
+_ui_scaling_re = re.compile(r"([0-9]{2})%$")
+
 
 class Ns_Main_Gui(QMainWindow):
     def __init__(self, *args, with_button_pdb: bool = False, **kwargs):
@@ -86,9 +83,10 @@ class Ns_Main_Gui(QMainWindow):
 
         self.action_toggle = self.menu_tray.addAction("Minimize to Tray")
         self.action_toggle.triggered.connect(self.toggle_window)
-        self.menu_tray.aboutToShow.connect(
-            lambda: self.action_toggle.setText("Minimize to Tray" if self.isVisible() else f"Show {__title__}")
-        )
+        # Build the "Show ..." text once instead of re-formatting it on every
+        # aboutToShow
+        self._tray_show_text = f"Show {__title__}"
+        self.menu_tray.aboutToShow.connect(self.update_tray_toggle_text)
         self.menu_tray.addSeparator()
 
         self.action_quit = self.menu_tray.addAction("Quit")
@@ -98,6 +96,9 @@ class Ns_Main_Gui(QMainWindow):
         self.trayicon.setContextMenu(self.menu_tray)
         self.trayicon.show()
 
+    def update_tray_toggle_text(self) -> None:
+        self.action_toggle.setText("Minimize to Tray" if self.isVisible() else self._tray_show_text)
+
     # https://github.com/zealdocs/zeal/blob/9630cc94c155d87295e51b41fbab2bd5798f8229/src/libs/ui/mainwindow.cpp#L447
     def bring_to_front(self) -> None:
         self.show()
@@ -119,12 +120,11 @@ class Ns_Main_Gui(QMainWindow):
         if not IS_MAC:
             return
 
-        for widget in parent.children():
-            if widget.children():
-                self.fix_macos_layout(widget)
-            else:
-                if isinstance(widget, QWidget) and not isinstance(widget, QPushButton):
-                    widget.setAttribute(Qt.WidgetAttribute.WA_LayoutUsesWidgetRect)
+        # findChildren traverses the widget tree on the C++ side, avoiding
+        # Python recursion over every child
+        for widget in parent.findChildren(QWidget):
+            if not widget.children() and not isinstance(widget, QPushButton):
+                widget.setAttribute(Qt.WidgetAttribute.WA_LayoutUsesWidgetRect)
 
     def setup_menu(self):
         # File
@@ -185,6 +185,7 @@ class Ns_Main_Gui(QMainWindow):
             return
 
         file_paths: list[str] = []
+        file_sizes: dict[str, int] = {}
 
         if Ns_Settings.value("Import/include-files-in-subfolders", type=bool):
             file_paths.extend(
@@ -193,14 +194,20 @@ class Ns_Main_Gui(QMainWindow):
                 for file_name in file_names
             )
         else:
-            file_paths.extend(
-                os_path.join(folder_path, file_name) for file_name in next(os.walk(folder_path))[2]
-            )
+            # A plain scandir pass: no need for os.walk's recursion machinery
+            # for a single directory
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        file_paths.append(entry.path)
+                        # DirEntry caches the stat result, sparing
+                        # add_file_paths a getsize syscall per file
+                        file_sizes[entry.path] = entry.stat().st_size
 
         if len(file_paths) == 0:
             self.statusBar().showMessage("No files found")
 
-        self.add_file_paths(file_paths)
+        self.add_file_paths(file_paths, sizes=file_sizes)
 
     def menu_file_open_file(self):
         file_paths, _ = QFileDialog.getOpenFileNames(
@@ -216,6 +223,8 @@ class Ns_Main_Gui(QMainWindow):
 
     def menu_file_clear_cache(self):
         if any(Ns_Cache.yield_cname_cpath_csize_fpath()):
+            from neosca.ns_widgets.ns_dialogs import Ns_Dialog_Table_Cache
+
             Ns_Dialog_Table_Cache(self).open()
         else:
             QMessageBox.information(self, "No Caches", "There are no caches to clear.")
@@ -227,6 +236,8 @@ class Ns_Main_Gui(QMainWindow):
             self.action_clear_cache.setEnabled(False)
 
     def menu_prefs_settings(self) -> None:
+        from neosca.ns_settings.ns_dialog_settings import Ns_Dialog_Settings
+
         Ns_Dialog_Settings(self).open()
 
     def menu_prefs_enlarge_font(self) -> None:
@@ -266,12 +277,18 @@ class Ns_Main_Gui(QMainWindow):
         Ns_Settings.setValue("show-statusbar", self.statusBar().isVisible())
 
     def menu_help_citing(self) -> None:
+        from neosca.ns_widgets.ns_dialogs import Ns_Dialog_TextEdit_Citing
+
         Ns_Dialog_TextEdit_Citing(self).open()
 
     def menu_help_acks(self) -> None:
+        from neosca.ns_widgets.ns_dialogs import Ns_Dialog_Table_Acknowledgments
+
         Ns_Dialog_Table_Acknowledgments(self).open()
 
     def menu_help_about(self) -> None:
+        from neosca.ns_widgets.ns_dialogs import Ns_Dialog_About
+
         Ns_Dialog_About(self).open()
 
     def setup_tab_sca(self):
@@ -289,14 +306,16 @@ class Ns_Main_Gui(QMainWindow):
         self.tableview_sca.setItemDelegate(Ns_StyledItemDelegate_Matches(self))
 
         # Bind
+        # functools.partial over lambdas: no Python closure to keep alive and
+        # dispatch stays at the C level
         self.button_generate_table_sca.clicked.connect(self.ns_thread_sca_generate_table.start)
         self.button_export_table_sca.clicked.connect(
-            lambda: self.tableview_sca.export_table("neosca_sca_results.xlsx")
+            functools.partial(self.tableview_sca.export_table, "neosca_sca_results.xlsx")
         )
         self.button_export_matches_sca.clicked.connect(
-            lambda: self.tableview_sca.export_matches("neosca_sca_matches.xlsx")
+            functools.partial(self.tableview_sca.export_matches, "neosca_sca_matches.xlsx")
         )
-        self.button_clear_table_sca.clicked.connect(lambda: self.model_sca.clear_data(confirm=True))
+        self.button_clear_table_sca.clicked.connect(functools.partial(self.model_sca.clear_data, confirm=True))
         self.model_sca.data_cleared.connect(self.on_model_sca_data_cleared)
         self.model_sca.row_added.connect(self.on_model_sca_row_added)
 
@@ -304,21 +323,19 @@ class Ns_Main_Gui(QMainWindow):
         self.layout_previewarea_sca = QGridLayout()
         self.widget_previewarea_sca.setLayout(self.layout_previewarea_sca)
 
-        btn_no = 0
-        for btn_no, btn in enumerate(
-            (
-                self.button_generate_table_sca,
-                self.button_export_table_sca,
-                self.button_export_matches_sca,
-                self.button_clear_table_sca,
-            ),
-            start=1,
-        ):
-            self.layout_previewarea_sca.addWidget(btn, 1, btn_no - 1)
+        buttons_sca = (
+            self.button_generate_table_sca,
+            self.button_export_table_sca,
+            self.button_export_matches_sca,
+            self.button_clear_table_sca,
+        )
+        for colno, btn in enumerate(buttons_sca):
+            self.layout_previewarea_sca.addWidget(btn, 1, colno)
+        col_count = len(buttons_sca)
         if self.with_button_pdb:
-            self.layout_previewarea_sca.addWidget(self.button_pdb, 1, btn_no)
-            btn_no += 1
-        self.layout_previewarea_sca.addWidget(self.tableview_sca, 0, 0, 1, btn_no)
+            self.layout_previewarea_sca.addWidget(self.button_pdb, 1, col_count)
+            col_count += 1
+        self.layout_previewarea_sca.addWidget(self.tableview_sca, 0, 0, 1, col_count)
 
         self.layout_previewarea_sca.setContentsMargins(0, 0, 0, 0)
 
@@ -337,21 +354,6 @@ class Ns_Main_Gui(QMainWindow):
         self.button_clear_table_sca.setEnabled(True)
 
     def run_pdb(self):
-        # import gc
-        # import time
-        #
-        # from neosca.ns_sca.ns_sca_counter import Structure, StructureCounter
-        # counters =[]
-        # ss = []
-        # for o in gc.get_objects():
-        #     if isinstance(o, StructureCounter):
-        #         counters.append(o)
-        #     elif isinstance(o, Structure):
-        #         ss.append(o)
-        # gc.collect()
-        # filename = "{}.txt".format(time.strftime("%H-%M-%S"))
-        # with open(filename, "w") as f:
-        #     f.write("\n".join(str(o) for o in gc.get_objects()))
         breakpoint()
 
     def setup_tab_lca(self):
@@ -368,12 +370,12 @@ class Ns_Main_Gui(QMainWindow):
         # Bind
         self.button_generate_table_lca.clicked.connect(self.ns_thread_lca_generate_table.start)
         self.button_export_table_lca.clicked.connect(
-            lambda: self.tableview_lca.export_table("neosca_lca_results.xlsx")
+            functools.partial(self.tableview_lca.export_table, "neosca_lca_results.xlsx")
         )
         self.button_export_matches_lca.clicked.connect(
-            lambda: self.tableview_lca.export_matches("neosca_lca_matches.xlsx")
+            functools.partial(self.tableview_lca.export_matches, "neosca_lca_matches.xlsx")
         )
-        self.button_clear_table_lca.clicked.connect(lambda: self.model_lca.clear_data(confirm=True))
+        self.button_clear_table_lca.clicked.connect(functools.partial(self.model_lca.clear_data, confirm=True))
         self.model_lca.data_cleared.connect(self.on_model_lca_data_cleared)
         self.model_lca.row_added.connect(self.on_model_lca_row_added)
 
@@ -381,18 +383,15 @@ class Ns_Main_Gui(QMainWindow):
         self.layout_previewarea_lca = QGridLayout()
         self.widget_previewarea_lca.setLayout(self.layout_previewarea_lca)
 
-        btn_no = 0
-        for btn_no, btn in enumerate(
-            (
-                self.button_generate_table_lca,
-                self.button_export_table_lca,
-                self.button_export_matches_lca,
-                self.button_clear_table_lca,
-            ),
-            start=1,
-        ):
-            self.layout_previewarea_lca.addWidget(btn, 1, btn_no - 1)
-        self.layout_previewarea_lca.addWidget(self.tableview_lca, 0, 0, 1, btn_no)
+        buttons_lca = (
+            self.button_generate_table_lca,
+            self.button_export_table_lca,
+            self.button_export_matches_lca,
+            self.button_clear_table_lca,
+        )
+        for colno, btn in enumerate(buttons_lca):
+            self.layout_previewarea_lca.addWidget(btn, 1, colno)
+        self.layout_previewarea_lca.addWidget(self.tableview_lca, 0, 0, 1, len(buttons_lca))
 
         self.layout_previewarea_lca.setContentsMargins(0, 0, 0, 0)
 
@@ -427,9 +426,22 @@ class Ns_Main_Gui(QMainWindow):
         self.restore_splitters(use_default=True)
         self.statusBar().showMessage("Layout reset")
 
+    def on_tabwidget_current_changed(self, index: int) -> None:
+        if index != self.tabwidget.indexOf(self.widget_placeholder_lca):
+            return
+        self.setup_tab_lca()
+        self.tabwidget.removeTab(index)
+        self.tabwidget.insertTab(index, self.widget_previewarea_lca, "Lexical Complexity Analyzer")
+        self.tabwidget.setCurrentIndex(index)
+        self.fix_macos_layout(self.widget_previewarea_lca)
+        # Catch up on the state the eager setup would have accumulated
+        self.button_generate_table_lca.setEnabled(not self.model_file.is_empty())
+
     def enable_button_generate_table(self, enabled: bool) -> None:
         self.button_generate_table_sca.setEnabled(enabled)
-        self.button_generate_table_lca.setEnabled(enabled)
+        # The LCA tab, and thus its buttons, may not have been built yet
+        if hasattr(self, "button_generate_table_lca"):
+            self.button_generate_table_lca.setEnabled(enabled)
 
     def setup_tableview_file(self) -> None:
         self.model_file = Ns_StandardItemModel_File(self)
@@ -563,6 +575,8 @@ class Ns_Main_Gui(QMainWindow):
         name_index: QModelIndex = self.tableview_file.selectionModel().selectedRows(column=0)[0]
         path_index: QModelIndex = self.tableview_file.selectionModel().selectedRows(column=1)[0]
 
+        from neosca.ns_widgets.ns_dialogs import Ns_Dialog_Table_Subfiles
+
         Ns_Dialog_Table_Subfiles(self, name_index, path_index).open()
 
     def remove_file_paths(self) -> None:
@@ -578,10 +592,17 @@ class Ns_Main_Gui(QMainWindow):
             )
         )
         # Remove rows from bottom up, or otherwise lower row indexes will
-        # change as upper rows are removed
+        # change as upper rows are removed. Collapse contiguous runs into a
+        # single removeRows call each: one row-removal signal per run instead
+        # of one per row
         rownos = sorted((index.row() for index in indexes), reverse=True)
-        for rowno in rownos:
-            self.model_file.takeRow(rowno)
+        i = 0
+        while i < len(rownos):
+            j = i
+            while j + 1 < len(rownos) and rownos[j + 1] == rownos[j] - 1:
+                j += 1
+            self.model_file.removeRows(rownos[j], j - i + 1)
+            i = j + 1
         if self.model_file.rowCount() == 0:
             self.model_file.clear_data()
 
@@ -595,29 +616,47 @@ class Ns_Main_Gui(QMainWindow):
             self.action_tableview_file_remove.setEnabled(True)
         self.menu_tableview_file.exec(QCursor.pos())
 
-    def add_file_paths(self, file_paths_to_add: list[str]) -> None:
+    def add_file_paths(self, file_paths_to_add: list[str], sizes: dict[str, int] | None = None) -> None:
+        if sizes is None:
+            sizes = {}
+
+        def get_size(file_path: str) -> int:
+            return sizes[file_path] if file_path in sizes else os_path.getsize(file_path)
+
         unique_file_paths_to_add: set[str] = set(file_paths_to_add)
         already_added_file_paths: set[str] = set(self.model_file.yield_flat_file_paths())
-        file_paths_dup: set[str] = unique_file_paths_to_add & already_added_file_paths
-        file_paths_unsupported: set[str] = set(filter(Ns_IO.not_supports, unique_file_paths_to_add))
-        file_paths_empty: set[str] = set(filter(lambda p: not os_path.getsize(p), unique_file_paths_to_add))
-        file_paths_ok: set[str] = (
-            unique_file_paths_to_add
-            - already_added_file_paths
-            - file_paths_dup
-            - file_paths_unsupported
-            - file_paths_empty
-        )
+        # One pass over the candidates; a path can land in several error
+        # categories at once, as before
+        file_paths_dup: set[str] = set()
+        file_paths_unsupported: set[str] = set()
+        file_paths_empty: set[str] = set()
+        file_paths_ok: set[str] = set()
+        for file_path in unique_file_paths_to_add:
+            has_err = False
+            if file_path in already_added_file_paths:
+                file_paths_dup.add(file_path)
+                has_err = True
+            if Ns_IO.not_supports(file_path):
+                file_paths_unsupported.add(file_path)
+                has_err = True
+            if not get_size(file_path):
+                file_paths_empty.add(file_path)
+                has_err = True
+            if not has_err:
+                file_paths_ok.add(file_path)
         if file_paths_ok:
             self.model_file.remove_empty_rows()
-            already_added_file_stems = list(self.model_file.yield_flat_file_names())
+            # Use a set: ensure_unique_filestem probes membership repeatedly
+            already_added_file_stems = set(self.model_file.yield_flat_file_names())
             for file_path in sorted(file_paths_ok):
                 file_stem = Path(file_path).stem
                 file_stem = Ns_IO.ensure_unique_filestem(file_stem, already_added_file_stems)
-                already_added_file_stems.append(file_stem)
+                already_added_file_stems.add(file_stem)
                 rowno = self.model_file.rowCount()
                 self.model_file.set_row_left_shifted(rowno, (file_stem, file_path))
-                self.model_file.row_added.emit()
+            # One emission after the whole batch: every per-row emission
+            # would re-run the button-state handlers
+            self.model_file.row_added.emit()
 
             num = len(file_paths_ok)
             noun = "file" if num == 1 else "files"
@@ -627,15 +666,25 @@ class Ns_Main_Gui(QMainWindow):
             model_err_files = Ns_StandardItemModel(
                 self, hor_labels=("Error Type", "File Path"), show_empty_row=False
             )
+            # Pre-size the model so all rows land in a single insertion block
+            # instead of one rowsInserted signal per appendRow
+            model_err_files.setRowCount(
+                len(file_paths_dup) + len(file_paths_unsupported) + len(file_paths_empty)
+            )
+            rowno = 0
             for reason, file_paths in (
                 ("Duplicate file", file_paths_dup),
                 ("Unsupported file type", file_paths_unsupported),
                 ("Empty file", file_paths_empty),
             ):
                 for file_path in sorted(file_paths):
-                    model_err_files.appendRow((QStandardItem(reason), QStandardItem(file_path)))
+                    model_err_files.setItem(rowno, 0, QStandardItem(reason))
+                    model_err_files.setItem(rowno, 1, QStandardItem(file_path))
+                    rowno += 1
             tableview_err_files = Ns_TableView(self, model=model_err_files)
 
+            from neosca.ns_widgets.ns_dialogs import Ns_Dialog_Table
+
             dialog = Ns_Dialog_Table(
                 self,
                 title="Error Adding Files",
@@ -649,12 +698,15 @@ class Ns_Main_Gui(QMainWindow):
 
     def setup_main_window(self):
         self.setup_tab_sca()
-        self.setup_tab_lca()
         self.setup_tableview_file()
 
         self.tabwidget = QTabWidget()
         self.tabwidget.addTab(self.widget_previewarea_sca, "Syntactic Complexity Analyzer")
-        self.tabwidget.addTab(self.widget_previewarea_lca, "Lexical Complexity Analyzer")
+        # The LCA tab is built on demand the first time it is selected; until
+        # then a placeholder keeps the tab bar complete
+        self.widget_placeholder_lca = QWidget()
+        self.tabwidget.addTab(self.widget_placeholder_lca, "Lexical Complexity Analyzer")
+        self.tabwidget.currentChanged.connect(self.on_tabwidget_current_changed)
         self.splitter_central_widget: QSplitter = QSplitter(Qt.Orientation.Vertical)
         self.splitter_central_widget.setChildrenCollapsible(False)
         self.splitter_central_widget.addWidget(self.tabwidget)
@@ -670,17 +722,16 @@ class Ns_Main_Gui(QMainWindow):
         self.ns_thread_sca_generate_table = Ns_Thread(self.ns_worker_sca_generate_table)
         self.ns_thread_sca_generate_table.started.connect(self.dialog_processing.open)
         self.ns_thread_sca_generate_table.finished.connect(self.dialog_processing.accept)
-        self.ns_thread_sca_generate_table.err_occurs.connect(
-            lambda ex: Ns_Dialog_TextEdit_Err(self, ex=ex).open()
-        )
+        self.ns_thread_sca_generate_table.err_occurs.connect(self.on_worker_err_occurs)
 
         self.ns_worker_lca_generate_table = Ns_Worker_LCA_Generate_Table(main=self)
         self.ns_thread_lca_generate_table = Ns_Thread(self.ns_worker_lca_generate_table)
         self.ns_thread_lca_generate_table.started.connect(self.dialog_processing.open)
         self.ns_thread_lca_generate_table.finished.connect(self.dialog_processing.accept)
-        self.ns_thread_lca_generate_table.err_occurs.connect(
-            lambda ex: Ns_Dialog_TextEdit_Err(self, ex=ex).open()
-        )
+        self.ns_thread_lca_generate_table.err_occurs.connect(self.on_worker_err_occurs)
+
+    def on_worker_err_occurs(self, ex: Exception) -> None:
+        Ns_Dialog_TextEdit_Err(self, ex=ex).open()
 
     # Override
     def close(self) -> bool:
@@ -709,7 +760,7 @@ class Ns_Main_Gui(QMainWindow):
 def main_gui():
     ui_scaling = Ns_Settings.value("Appearance/scaling")
     # https://github.com/BLKSerene/Wordless/blob/main/wordless/wl_main.py#L1238
-    os.environ["QT_SCALE_FACTOR"] = re.sub(r"([0-9]{2})%$", r".\1", ui_scaling)
+    os.environ["QT_SCALE_FACTOR"] = _ui_scaling_re.sub(r".\1", ui_scaling)
     ns_app = QApplication(sys.argv)
     ns_window = Ns_Main_Gui(with_button_pdb=False)
     ns_window.showMaximized()
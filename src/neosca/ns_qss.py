@@ -9,6 +9,13 @@ from PyQt5.QtWidgets import QWidget
 
 QSSMapping = dict[str, str | dict[str, str]]
 
+# Either a brace or a run of non-brace, non-whitespace chars: yields the same
+# tokens as padding braces with spaces and then splitting, in a single scan
+_qss_token_re = re.compile(r"[{}]|[^\s{}]+")
+
+# {qss_file_path: (mtime, content)}
+_qss_file_cache: dict[str, tuple[float, str]] = {}
+
 
 class Ns_QSS:
     def __init__(self):
@@ -17,8 +24,15 @@ class Ns_QSS:
     @staticmethod
     def read_qss_file(qss_file_path: str | PathLike, default: Any = ""):
         if os_path.isfile(qss_file_path) and os_path.getsize(qss_file_path) > 0:
+            key = str(qss_file_path)
+            mtime = os_path.getmtime(qss_file_path)
+            cached = _qss_file_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
             with open(qss_file_path, encoding="utf-8") as file:
-                return file.read()
+                content = file.read()
+            _qss_file_cache[key] = (mtime, content)
+            return content
         else:
             return default
 
@@ -29,36 +43,40 @@ class Ns_QSS:
         >>> get_value(qss, "QHeaderView::section:horizontal", "background-color")
         #5C88C5
         """
-        selector = re.escape(selector)
-        property = re.escape(property)
-
         # Note that only value of the 1st matched selector returned
-        matched_selector = re.search(rf"{selector}[ }}]", qss)
-        if matched_selector is None:
+        pos = 0
+        while (pos := qss.find(selector, pos)) != -1:
+            selector_end = pos + len(selector)
+            if selector_end < len(qss) and qss[selector_end] in " }":
+                break
+            pos = selector_end
+        else:
             return None
-        matched_value = re.search(rf"[^}}]+{property}:\s*([^;]+);", qss[matched_selector.end() :])
+
+        property = re.escape(property)
+        matched_value = re.search(rf"[^}}]+{property}:\s*([^;]+);", qss[selector_end + 1 :])
         if matched_value is None:
             return None
         return matched_value.group(1)
 
     @classmethod
     def mapping_to_str(cls, mapping: QSSMapping) -> str:
-        qss_str = ""
+        qss_str_parts = []
         for selector, declaration in mapping.items():
             if isinstance(declaration, str):
                 # str_to_mapping requires every value ends with ";"
                 if not declaration.endswith(";"):
                     declaration = f"{declaration};"
-                qss_str += f"{selector}: {declaration}\n"
+                qss_str_parts.append(f"{selector}: {declaration}\n")
             else:
-                qss_str += f"{selector} {{\n"  # }}
+                qss_str_parts.append(f"{selector} {{\n")  # }}
                 for property, value in declaration.items():
                     # str_to_mapping requires every value ends with ";"
                     if not value.endswith(";"):
                         value = f"{value};"
-                    qss_str += f"{property}: {value}\n"
-                qss_str += "}\n"
-        return qss_str
+                    qss_str_parts.append(f"{property}: {value}\n")
+                qss_str_parts.append("}\n")
+        return "".join(qss_str_parts)
 
     @classmethod
     def str_to_mapping(cls, qss_str: str) -> QSSMapping:
@@ -93,8 +111,7 @@ class Ns_QSS:
         sel_dec_mapping: QSSMapping = {}
         curr_selector = None
         curr_property = None
-        qss_str = qss_str.replace("{", " { ").replace("}", " } ")
-        token_gen = iter(qss_str.split())
+        token_gen = (m.group() for m in _qss_token_re.finditer(qss_str))
         while (token := next(token_gen, None)) is not None:
             if token == "{":  # }
                 pass
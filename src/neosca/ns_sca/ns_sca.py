@@ -4,12 +4,28 @@ import logging
 import os
 import os.path as os_path
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from neosca.ns_io import Ns_Cache, Ns_IO
 from neosca.ns_sca.ns_sca_counter import Ns_SCA_Counter
 from neosca.ns_utils import Ns_Procedure_Result
 
 
+def _query_forest(
+    file_path: str,
+    forest: str,
+    selected_measures: list[str] | None,
+    user_structure_defs: list[dict[str, str]],
+) -> Ns_SCA_Counter:
+    # Module-level so ProcessPoolExecutor can pickle it; each worker builds
+    # and queries its own counter
+    counter = Ns_SCA_Counter(
+        file_path, selected_measures=selected_measures, user_structure_defs=user_structure_defs
+    )
+    counter.determine_all_values(forest)
+    return counter
+
+
 class Ns_SCA:
     def __init__(  # {{{
         self,
@@ -23,8 +39,10 @@ class Ns_SCA:
         is_stdout: bool = False,
         is_skip_parsing: bool = False,
         is_save_matches: bool = False,
+        is_zip_matches: bool = False,
         is_save_values: bool = True,
         config: str | None = None,
+        n_workers: int = 1,
     ) -> None:
         self.ofile_freq = ofile_freq
         self.oformat_freq = oformat_freq
@@ -36,7 +54,9 @@ class Ns_SCA:
         self.is_stdout = is_stdout
         self.is_skip_parsing = is_skip_parsing
         self.is_save_matches = is_save_matches
+        self.is_zip_matches = is_zip_matches
         self.is_save_values = is_save_values
+        self.n_workers = n_workers
 
         self.user_data, self.user_structure_defs, self.user_snames = self.load_user_config(config)
         logging.debug(f"User defined snames: {self.user_snames}")
@@ -45,6 +65,8 @@ class Ns_SCA:
             Ns_SCA_Counter.check_undefined_measure(selected_measures, self.user_snames)
 
         self.counters: list[Ns_SCA_Counter] = []
+        # {file_path: forest} parsed ahead of time by prefetch_parses
+        self._prefetched_forests: dict[str, str] = {}
 
     # }}}
     def load_user_config(self, config: str | None) -> tuple[dict, list[dict], set[str] | None]:  # {{{
@@ -70,17 +92,63 @@ class Ns_SCA:
         return forest
 
     # }}}
-    def get_forest_frm_file(self, file_path: str) -> str:  # {{{
+    def prefetch_parses(self, file_paths: list[str]) -> None:  # {{{
+        """
+        Batch-parse cache-miss files in a single pipeline call. Stanza's
+        neural inference amortizes across documents, so parsing many files at
+        once is much faster than one call per file; get_forest_frm_file picks
+        the results up from _prefetched_forests.
+        """
+        if self.is_skip_parsing:
+            return
+
+        miss_paths: list[str] = []
+        cache_paths: list[str | None] = []
+        for file_path in file_paths:
+            if file_path in self._prefetched_forests:
+                continue
+            cache_path, is_cache_available = Ns_Cache.get_cache_path(file_path)
+            if self.is_use_cache and is_cache_available:
+                continue
+            miss_paths.append(file_path)
+            cache_paths.append(cache_path if self.is_cache else None)
+        # A single miss gains nothing from batching
+        if len(miss_paths) < 2:
+            return
+
         from neosca.ns_nlp import Ns_NLP_Stanza
-        from stanza import Document
 
+        # File reads are I/O-bound and release the GIL, so overlap them
+        # instead of reading one file at a time
+        with ThreadPoolExecutor(max_workers=min(8, len(miss_paths))) as executor:
+            texts = list(executor.map(Ns_IO.load_file, miss_paths))
+        forests = Ns_NLP_Stanza.get_constituency_forest_batch(texts, cache_paths=cache_paths)
+        self._prefetched_forests.update(zip(miss_paths, forests, strict=False))
+
+    # }}}
+    def get_forest_frm_file(self, file_path: str) -> str:  # {{{
         if self.is_skip_parsing:
             # Assume input as parse trees, e.g., (ROOT (S (NP) (VP)))
             return Ns_IO.load_file(file_path)
 
+        if (forest := self._prefetched_forests.pop(file_path, None)) is not None:
+            return forest
+
         cache_path, is_cache_available = Ns_Cache.get_cache_path(file_path)
         # Use cache
         if self.is_use_cache and is_cache_available:
+            # Prefer the forest sidecar: SCA only needs the tree text, so a
+            # hit skips rebuilding the Document object graph entirely
+            forest_path = Ns_Cache.get_forest_path(cache_path)
+            if os_path.exists(forest_path) and os_path.getsize(forest_path) > 0:
+                logging.info(f"Loading forest cache: {forest_path}.")
+                return Ns_IO.load_lzma(forest_path).decode("utf-8")
+
+            # Only the Document-deserializing fallback needs stanza (and,
+            # transitively, torch); keep the branches above import-free
+            from neosca.ns_nlp import Ns_NLP_Stanza
+            from stanza import Document
+
             logging.info(f"Loading cache: {cache_path}.")
             doc: Document = Ns_NLP_Stanza.serialized2doc(Ns_IO.load_lzma(cache_path))
             return Ns_NLP_Stanza.get_constituency_forest(doc, cache_path=cache_path)
@@ -91,15 +159,22 @@ class Ns_SCA:
         if not self.is_cache:
             cache_path = None  # type: ignore
 
+        # try/finally instead of "except BaseException ... raise" so that
+        # KeyboardInterrupt both propagates promptly and still triggers the
+        # cleanup of a cache generated at current run, which is potentially broken
+        is_succeeded = False
         try:
             forest = self.get_forest_frm_text(text, cache_path)
-        except BaseException as e:
-            # If cache is generated at current run, remove it as it is potentially broken
-            if cache_path is not None and os_path.exists(cache_path) and not is_cache_available:
-                os.remove(cache_path)
-            raise e
-        else:
+            is_succeeded = True
             return forest
+        finally:
+            if (
+                not is_succeeded
+                and cache_path is not None
+                and os_path.exists(cache_path)
+                and not is_cache_available
+            ):
+                os.remove(cache_path)
 
     # }}}
     def run_on_text(self, text: str, *, file_path: str = "cli_text", clear: bool = True) -> None:  # {{{
@@ -146,7 +221,10 @@ class Ns_SCA:
             for i, subfile in enumerate(subfiles, 1):
                 logging.info(f'Processing "{subfile}" ({i}/{total})...')
                 child_counter = self.run_on_file_or_subfiles(subfile)
-                counter += child_counter
+                counter.merge_counts(child_counter)
+            # Derive value_source measures once from the accumulated counts
+            # instead of re-calculating them after every subfile
+            counter.determine_all_values()
         else:
             raise ValueError(f"file_or_subfiles {file_or_subfiles} is neither str nor list")
         return counter
@@ -158,19 +236,88 @@ class Ns_SCA:
         if clear:
             self.counters.clear()
 
-        for file_or_subfiles in file_or_subfiles_list:
-            counter = self.run_on_file_or_subfiles(file_or_subfiles)
-            self.counters.append(counter)
+        self.prefetch_parses(
+            [
+                file_path
+                for file_or_subfiles in file_or_subfiles_list
+                for file_path in (
+                    (file_or_subfiles,) if isinstance(file_or_subfiles, str) else file_or_subfiles
+                )
+            ]
+        )
+        if self.n_workers > 1:
+            self.counters.extend(self.query_parallel(file_or_subfiles_list))
+        else:
+            for file_or_subfiles in file_or_subfiles_list:
+                counter = self.run_on_file_or_subfiles(file_or_subfiles)
+                self.counters.append(counter)
 
         if self.is_save_matches:
             self.dump_matches()
         if self.is_save_values:
             self.dump_values()
 
+    # }}}
+    def query_parallel(  # {{{
+        self, file_or_subfiles_list: list[str | list[str]]
+    ) -> list[Ns_SCA_Counter]:
+        """
+        Farm the CPU-bound querying out to a process pool, one task per file.
+        Parsing and cache I/O stay in the main process (get_forest_frm_file is
+        called here); subfile counters are merged with merge_counts after their
+        workers return. Results keep the input order.
+        """
+        from concurrent.futures import Future, ProcessPoolExecutor
+
+        counters: list[Ns_SCA_Counter] = []
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            futures: list[Future | list[Future]] = []
+            for file_or_subfiles in file_or_subfiles_list:
+                if isinstance(file_or_subfiles, str):
+                    futures.append(self._submit_query(executor, file_or_subfiles))
+                elif isinstance(file_or_subfiles, list):
+                    futures.append([self._submit_query(executor, subfile) for subfile in file_or_subfiles])
+                else:
+                    raise ValueError(f"file_or_subfiles {file_or_subfiles} is neither str nor list")
+            for future_or_futures in futures:
+                if isinstance(future_or_futures, list):
+                    counter = Ns_SCA_Counter(
+                        selected_measures=self.selected_measures,
+                        user_structure_defs=self.user_structure_defs,
+                    )
+                    for future in future_or_futures:
+                        counter.merge_counts(future.result())
+                    counter.determine_all_values()
+                    counters.append(counter)
+                else:
+                    counters.append(future_or_futures.result())
+        return counters
+
+    def _submit_query(self, executor, file_path: str):
+        return executor.submit(
+            _query_forest,
+            file_path,
+            self.get_forest_frm_file(file_path),
+            self.selected_measures,
+            self.user_structure_defs,
+        )
+
     # }}}
     def dump_matches(self) -> None:  # {{{
-        for counter in self.counters:
-            counter.dump_matches(self.odir_matched, self.is_stdout)
+        if self.is_stdout:
+            for counter in self.counters:
+                counter.dump_matches(self.odir_matched, self.is_stdout)
+            return
+
+        # Each counter writes into its own subdirectory, so the I/O-bound
+        # writes are independent and can overlap
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            futures = [
+                executor.submit(counter.dump_matches, self.odir_matched, is_zipped=self.is_zip_matches)
+                for counter in self.counters
+            ]
+            for future in futures:
+                future.result()
 
     # }}}
     def dump_values(self) -> None:  # {{{
@@ -179,25 +326,44 @@ class Ns_SCA:
         if len(self.counters) == 0:
             raise ValueError("empty counter list")
 
-        sname_value_maps: list[dict[str, str]] = [
-            counter.get_all_values(self.precision) for counter in self.counters
-        ]
-
-        handle = sys.stdout if self.is_stdout else open(self.ofile_freq, "w", encoding="utf-8", newline="")  # noqa: SIM115
+        # A 1 MiB buffer keeps large result tables from flushing every 8 KiB
+        handle = (
+            sys.stdout
+            if self.is_stdout
+            else open(self.ofile_freq, "w", encoding="utf-8", newline="", buffering=1 << 20)  # noqa: SIM115
+        )
 
+        # Rows are produced one counter at a time so only a single
+        # get_all_values dict is alive during the write
         if self.oformat_freq == "csv":
             import csv
 
-            fieldnames = sname_value_maps[0].keys()
-            csv_writer = csv.DictWriter(handle, fieldnames=fieldnames)
-
-            csv_writer.writeheader()
-            csv_writer.writerows(sname_value_maps)
+            # Every get_all_values dict shares the same key order, so plain
+            # writer rows avoid DictWriter's per-row fieldname lookups
+            csv_writer = csv.writer(handle)
+            first_value_map = self.counters[0].get_all_values(self.precision)
+            csv_writer.writerow(first_value_map.keys())
+            csv_writer.writerow(first_value_map.values())
+            csv_writer.writerows(
+                counter.get_all_values(self.precision).values() for counter in self.counters[1:]
+            )
 
         elif self.oformat_freq == "json":
             import json
-
-            json.dump(sname_value_maps, handle, ensure_ascii=False, indent=2)
+            import textwrap
+
+            # Serialize one counter at a time, then emit everything in a
+            # single write: stdout may be a pipe, where json.dump's many small
+            # writes each cost a syscall. The output is byte-identical to
+            # json.dump over the whole list
+            elements = (
+                textwrap.indent(
+                    json.dumps(counter.get_all_values(self.precision), ensure_ascii=False, indent=2),
+                    "  ",
+                )
+                for counter in self.counters
+            )
+            handle.write("[\n" + ",\n".join(elements) + "\n]")
         else:
             raise ValueError(f'oformat_freq {self.oformat_freq} not in ("csv", "json")')
 
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import functools
 import io
 import logging
 import os
@@ -8,8 +9,10 @@ import re
 import shutil
 import sys
 import tokenize
+import zipfile
 from collections import OrderedDict
 from copy import deepcopy
+from types import CodeType
 
 from neosca import DATA_DIR
 from neosca.ns_about import __title__
@@ -19,6 +22,52 @@ from neosca.ns_sca import l2sca
 from neosca.ns_tregex.tree import Tree
 from neosca.ns_utils import safe_div
 
+# Only accept alphanumeric chars, underscore, and hyphen; "/" means division
+# and becomes "-per-"
+_sname_unsafe_char_re = re.compile(r"[^\w-]")
+
+# A terminal node whose label is an all-cap POS tag and whose leaf is not a
+# punctuation mark counts as a word
+_word_re = re.compile(r"\([A-Z]+\$? [^()—–-]+\)")
+
+
+# Every searcher re-walks the same forest, so keep the most recently parsed
+# one around instead of re-running Tree.fromstring once per structure
+@functools.lru_cache(maxsize=1)
+def _parse_forest(forest: str) -> tuple[Tree, ...]:
+    return tuple(Tree.fromstring(forest))
+
+
+# The same value_source string is evaluated once per counter, i.e. once per
+# file; tokenizing and compiling it over and over only yields the same code
+# object, so do that pass once per distinct expression
+@functools.lru_cache
+def _parse_value_source(value_source: str) -> tuple[tuple[str, ...], CodeType, bool]:
+    tokens = []
+    snames: list[str] = []
+    is_addition_only: bool = True
+    for t in tokenize.generate_tokens(io.StringIO(value_source).readline):
+        token_type, token_string, *_ = t
+        if token_type == tokenize.NAME:
+            snames.append(token_string)
+            tokens.append((token_type, f"self.get_structure('{token_string}')"))
+        elif token_type == tokenize.NUMBER or token_string in ("(", ")"):
+            tokens.append((token_type, token_string))
+        elif token_string in ("+", "-", "*", "/"):
+            tokens.append((token_type, token_string))
+            if token_string != "+":
+                is_addition_only = False
+        # Limit value_source as only NAMEs and numberic operators to assure security for `eval`
+        elif token_string != "":
+            raise InvalidSourceError(f'Unexpected token: "{token_string}"')
+    # Append "+ 0" to force tokens evaluated as number if value_source contains just name of another Structure
+    tokens.extend(((tokenize.PLUS, "+"), (tokenize.NUMBER, "0")))
+    return tuple(snames), compile(tokenize.untokenize(tokens), "<value_source>", "eval"), is_addition_only
+
+
+def _escape_sname(sname: str) -> str:
+    return _sname_unsafe_char_re.sub(lambda m: "-per-" if m.group() == "/" else "", sname)
+
 
 class Ns_SCA_Structure:
     def __init__(
@@ -324,16 +373,24 @@ class Ns_SCA_Counter:
             raise ValueError(f"{sname} is not yet supported in {__title__}.")
 
         matches = []
-        last_node = None
-        for tree in Tree.fromstring(forest):
-            for node in cls.SNAME_SEARCHER_MAPPING[sname].searchNodeIterator(tree):
-                if node is last_node:
-                    # Mimic Tregex's -o option
-                    # https://github.com/stanfordnlp/CoreNLP/blob/efc66a9cf49fecba219dfaa4025315ad966285cc/src/edu/stanford/nlp/trees/tregex/TregexPattern.java#L885
-                    continue
-                last_node = node
-                span_string = node.span_string()
-                matches.append(span_string)
+        # Corpora with boilerplate repeat many short sentences verbatim, and
+        # identical trees always yield identical matches: query each distinct
+        # tree once and replay its matches for the duplicates
+        tree_matches_cache: dict[str, list[str]] = {}
+        for tree in _parse_forest(forest):
+            tree_key = repr(tree)
+            if (tree_matches := tree_matches_cache.get(tree_key)) is None:
+                tree_matches = []
+                last_node = None
+                for node in cls.SNAME_SEARCHER_MAPPING[sname].searchNodeIterator(tree):
+                    if node is last_node:
+                        # Mimic Tregex's -o option
+                        # https://github.com/stanfordnlp/CoreNLP/blob/efc66a9cf49fecba219dfaa4025315ad966285cc/src/edu/stanford/nlp/trees/tregex/TregexPattern.java#L885
+                        continue
+                    last_node = node
+                    tree_matches.append(node.span_string())
+                tree_matches_cache[tree_key] = tree_matches
+            matches.extend(tree_matches)
         return matches
 
     def exec_value_source(
@@ -343,35 +400,20 @@ class Ns_SCA_Counter:
         forest: str,
         ancestor_snames: list[str],
     ) -> tuple[float | int, list[str]]:
-        tokens = []
+        source_snames, code, is_addition_only = _parse_value_source(value_source)
         matches: list[str] = []
-        is_addition_only: bool = True
-        for t in tokenize.generate_tokens(io.StringIO(value_source).readline):
-            token_type, token_string, *_ = t
-            if token_type == tokenize.NAME:
-                ancestor_snames.append(sname)
-                self.check_circular_def(token_string, ancestor_snames)
-                self.determine_value(token_string, forest, ancestor_snames)
-                if self.sname_is_terminal(token_string):
-                    # No circular definition problem for terminal node.
-                    ancestor_snames.clear()
-                get_structure_code = f"self.get_structure('{token_string}')"
-                if is_addition_only:
-                    matches.extend(self.get_matches(token_string))
-                tokens.append((token_type, get_structure_code))
-            elif token_type == tokenize.NUMBER or token_string in ("(", ")"):
-                tokens.append((token_type, token_string))
-            elif token_string in ("+", "-", "*", "/"):
-                tokens.append((token_type, token_string))
-                if token_string != "+":
-                    matches.clear()
-                    is_addition_only = False
-            # Limit value_source as only NAMEs and numberic operators to assure security for `eval`
-            elif token_string != "":
-                raise InvalidSourceError(f'Unexpected token: "{token_string}"')
-        # Append "+ 0" to force tokens evaluated as number if value_source contains just name of another Structure
-        tokens.extend(((tokenize.PLUS, "+"), (tokenize.NUMBER, "0")))
-        return eval(tokenize.untokenize(tokens)), matches
+        for source_sname in source_snames:
+            ancestor_snames.append(sname)
+            self.check_circular_def(source_sname, ancestor_snames)
+            self.determine_value(source_sname, forest, ancestor_snames)
+            if self.sname_is_terminal(source_sname):
+                # No circular definition problem for terminal node.
+                ancestor_snames.clear()
+            # Matches are only meaningful when the expression purely sums
+            # other structures; any other operator leaves them empty
+            if is_addition_only:
+                matches.extend(self.get_matches(source_sname))
+        return eval(code), matches
 
     def determine_value_from_tregex_pattern(self, sname: str, forest: str):
         structure = self.get_structure(sname)
@@ -414,7 +456,7 @@ class Ns_SCA_Counter:
 
         if sname == "W":
             logging.info(' Searching for "words"')
-            value = len(re.findall(r"\([A-Z]+\$? [^()—–-]+\)", forest))
+            value = len(_word_re.findall(forest))
             self.set_value(sname, value)
             return
 
@@ -429,30 +471,45 @@ class Ns_SCA_Counter:
         for sname in self.selected_measures:
             self.determine_value(sname, forest)
 
-    def dump_matches(self, odir_matched: str = "", is_stdout: bool = False) -> None:  # pragma: no cover
+    def dump_matches(
+        self, odir_matched: str = "", is_stdout: bool = False, is_zipped: bool = False
+    ) -> None:  # pragma: no cover
         bn_input = os_path.basename(self.ifile)
         bn_input_noext = os_path.splitext(bn_input)[0]
         subodir_matched = os_path.join(odir_matched, bn_input_noext).strip()
+        zf = None
         if not is_stdout:
-            shutil.rmtree(subodir_matched, ignore_errors=True)
-            os.makedirs(subodir_matched)
+            if is_zipped:
+                # One archive per input file amortizes the per-structure open()
+                # cost and directory metadata churn
+                if odir_matched:
+                    os.makedirs(odir_matched, exist_ok=True)
+                zf = zipfile.ZipFile(f"{subodir_matched}.zip", "w", compression=zipfile.ZIP_STORED)
+            else:
+                shutil.rmtree(subodir_matched, ignore_errors=True)
+                os.makedirs(subodir_matched, exist_ok=True)
+                fn_prefix = os_path.join(subodir_matched, bn_input_noext + "-")
         for sname, structure in self.sname_structure_map.items():
             matches = structure.matches
             if not matches:
                 continue
 
             meta_data = str(structure)
-            res = "\n".join(matches)
-            # Only accept alphanumeric chars, underscore, and hypen
-            escaped_sname = re.sub(r"[^\w-]", "", sname.replace("/", "-per-"))
+            escaped_sname = _escape_sname(sname)
             matches_id = bn_input_noext + "-" + escaped_sname
-            if not is_stdout:
-                extension = ".txt"
-                fn_match_output = os_path.join(subodir_matched, matches_id + extension)
-                with open(fn_match_output, "w", encoding="utf-8") as f:
-                    f.write(f"{meta_data}\n\n{res}\n")
+            if is_stdout:
+                sys.stdout.write(f"{matches_id}\n{meta_data}\n\n")
+                sys.stdout.writelines(f"{match}\n" for match in matches)
+            elif zf is not None:
+                # zipfile has no incremental writestr; join once here
+                zf.writestr(matches_id + ".txt", "\n".join((meta_data, "", *matches, "")))
             else:
-                sys.stdout.write(f"{matches_id}\n{meta_data}\n\n{res}\n")
+                fn_match_output = fn_prefix + escaped_sname + ".txt"
+                with open(fn_match_output, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    f.write(f"{meta_data}\n\n")
+                    f.writelines(f"{match}\n" for match in matches)
+        if zf is not None:
+            zf.close()
 
     def __add__(self, other: "Ns_SCA_Counter") -> "Ns_SCA_Counter":
         logging.debug("Combining counters...")
@@ -479,3 +536,39 @@ class Ns_SCA_Counter:
         new.determine_all_values()
 
         return new
+
+    def merge_counts(self, other: "Ns_SCA_Counter") -> None:
+        """
+        Accumulate other's tregex-backed counts and matches into self.
+        Callers must run determine_all_values afterwards to refresh measures
+        defined by value_source; doing so once after a whole merge chain is
+        cheaper than per merge step.
+        """
+        assert self.selected_measures == other.selected_measures
+
+        self.ifile = self.ifile + "+" + other.ifile if self.ifile else other.ifile
+        for sname, structure in self.sname_structure_map.items():
+            if structure.value_source is not None:
+                # Unset derived measures so the next determine_all_values
+                # re-calculates them from the accumulated counts
+                structure.value = None
+                continue
+
+            this_value = self.get_value(sname) or 0
+            that_value = other.get_value(sname) or 0
+            self.set_value(sname, this_value + that_value)
+            logging.debug(f"Combined {sname}: {this_value} + {that_value} = {this_value + that_value}")
+
+            self.extend_matches(sname, other.get_matches(sname))
+
+    def __iadd__(self, other: "Ns_SCA_Counter") -> "Ns_SCA_Counter":
+        if self.selected_measures != other.selected_measures:
+            # Differing measure sets need the full merge
+            return self + other
+
+        logging.debug("Combining counters in place...")
+        self.merge_counts(other)
+        # Re-calc measures defined by value_source
+        self.determine_all_values()
+
+        return self
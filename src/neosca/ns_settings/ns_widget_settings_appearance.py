@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import functools
+
 from PyQt5.QtGui import QFontDatabase
 from PyQt5.QtWidgets import (
     QCheckBox,
@@ -19,6 +21,17 @@ from neosca.ns_settings.ns_widget_settings_abstract import Ns_Widget_Settings_Ab
 from neosca.ns_widgets.ns_widgets import Ns_Combobox_Font
 
 
+# Installed fonts rarely change while the app runs, and styles() re-enumerates
+# OS fonts on every call; the combobox triggers this per keystroke
+@functools.lru_cache(maxsize=512)
+def _font_styles(family: str) -> tuple[str, ...]:
+    return tuple(QFontDatabase().styles(family))
+
+
+# https://github.com/BLKSerene/Wordless/blob/1c319ce54be60aa948c89d6d3cdd327cccfc7c15/wordless/wl_settings/wl_settings_general.py#L53
+_scaling_options: tuple[str, ...] = tuple(f"{opt}%" for opt in range(100, 301, 25))
+
+
 class Ns_Widget_Settings_Appearance(Ns_Widget_Settings_Abstract):
     name: str = "Appearance"
 
@@ -36,13 +49,11 @@ class Ns_Widget_Settings_Appearance(Ns_Widget_Settings_Abstract):
     def setup_scaling(self) -> None:
         label_scaling = QLabel("Scaling (requires restart):")
         self.combobox_scaling = QComboBox()
-        # https://github.com/BLKSerene/Wordless/blob/1c319ce54be60aa948c89d6d3cdd327cccfc7c15/wordless/wl_settings/wl_settings_general.py#L53
-        self.combobox_scaling.addItems([f"{opt}%" for opt in range(100, 301, 25)])
+        self.combobox_scaling.addItems(_scaling_options)
         self.formlayout_scaling = QFormLayout()
         self.formlayout_scaling.addRow(label_scaling, self.combobox_scaling)
 
     def setup_font(self) -> None:
-        self.database = QFontDatabase()
         self.combobox_family = Ns_Combobox_Font()
         self.spinbox_point_size = QSpinBox()
         self.spinbox_point_size.setSuffix(" pt")
@@ -63,7 +74,7 @@ class Ns_Widget_Settings_Appearance(Ns_Widget_Settings_Abstract):
         self.groupbox_font.setLayout(formlayout_font)
 
     def set_italic_bold_enabled(self, family: str) -> None:
-        available_styles = self.database.styles(family)
+        available_styles = _font_styles(family)
         if "Italic" in available_styles:
             self.checkbox_italic.setEnabled(True)
         else:
@@ -135,7 +146,9 @@ class Ns_Widget_Settings_Appearance(Ns_Widget_Settings_Abstract):
                 self,
             ).open()
             return False
-        if font_family not in self.database.families():
+        # The font combobox already lists every installed family; findText is
+        # a single C++ call instead of iterating families() in Python
+        if self.combobox_family.findText(font_family) == -1:
             self.combobox_family.lineEdit().setFocus()
             self.combobox_family.lineEdit().selectAll()
             QMessageBox(
@@ -161,33 +174,36 @@ class Ns_Widget_Settings_Appearance(Ns_Widget_Settings_Abstract):
         Ns_Settings.setValue(key, self.combobox_scaling.currentText())
 
     def apply_settings_font(self) -> None:
-        key = f"{self.name}/font-family"
         family = self.combobox_family.currentText()
-        Ns_Settings.setValue(key, family)
-
-        key = f"{self.name}/font-size"
         size = self.spinbox_point_size.value()
-        Ns_Settings.setValue(key, size)
-
-        key = f"{self.name}/font-italic"
         is_italic = self.checkbox_italic.isChecked()
-        Ns_Settings.setValue(key, is_italic)
-
-        key = f"{self.name}/font-bold"
         is_bold = self.checkbox_bold.isChecked()
-        Ns_Settings.setValue(key, is_bold)
-
-        Ns_QSS.update(
-            self.main,
-            {
-                "*": {
-                    "font-family": family,
-                    "font-size": f"{size}pt",
-                    "font-style": "italic" if is_italic else "normal",
-                    "font-weight": "bold" if is_bold else "normal",
-                }
-            },
-        )
+
+        # Group the four writes so QSettings resolves the section prefix once
+        Ns_Settings.beginGroup(self.name)
+        Ns_Settings.setValue("font-family", family)
+        Ns_Settings.setValue("font-size", size)
+        Ns_Settings.setValue("font-italic", is_italic)
+        Ns_Settings.setValue("font-bold", is_bold)
+        Ns_Settings.endGroup()
+
+        # Suspend repaints while the stylesheet is re-applied: setStyleSheet
+        # cascades a style recompute over every child widget
+        self.main.setUpdatesEnabled(False)
+        try:
+            Ns_QSS.update(
+                self.main,
+                {
+                    "*": {
+                        "font-family": family,
+                        "font-size": f"{size}pt",
+                        "font-style": "italic" if is_italic else "normal",
+                        "font-weight": "bold" if is_bold else "normal",
+                    }
+                },
+            )
+        finally:
+            self.main.setUpdatesEnabled(True)
 
     def apply_settings_table(self) -> None:
         key = f"{self.name}/triangle-height-ratio"
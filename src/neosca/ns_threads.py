@@ -44,22 +44,28 @@ class Ns_Worker_SCA_Generate_Table(Ns_Worker):
 
         sca_instance = Ns_SCA(**init_kwargs)
         model: Ns_StandardItemModel = self.main.model_sca
-        has_trailing_rows: bool = True
+        # Headers never change after setup; avoid a Qt round-trip per cell
+        snames = tuple(model.horizontalHeaderItem(colno).text() for colno in range(1, model.columnCount()))
         for rowno, (file_name, file_path) in enumerate(zip(file_names, file_paths, strict=False)):
             # TODO: add handling --no-parse, --no-query, ...
             counter: Ns_SCA_Counter | None = sca_instance.run_on_file_or_subfiles(file_path)
             assert counter is not None
 
-            if has_trailing_rows:
-                has_trailing_rows = model.removeRows(rowno, model.rowCount() - rowno)
+            # Clear leftover rows from a previous run only while there are
+            # any; once the model has caught up this is a no-op check
+            if rowno < model.rowCount():
+                model.removeRows(rowno, model.rowCount() - rowno)
 
-            model.set_item_left_shifted(rowno, 0, file_name)
-            for colno in range(1, model.columnCount()):
-                sname = model.horizontalHeaderItem(colno).text()
+            # Build the whole row first and install it with a single insertRow
+            # call, instead of one setItem round-trip per cell
+            row_items = [model.make_item_left_shifted(file_name)]
+            for sname in snames:
                 assert (value := counter.get_value(sname)) is not None
-                item = model.set_item_right_shifted(rowno, colno, value)
+                item = model.make_item_right_shifted(value)
                 if matches := counter.get_matches(sname):
                     item.setData(matches, Qt.ItemDataRole.UserRole)
+                row_items.append(item)
+            model.insertRow(rowno, row_items)
             model.row_added.emit()
 
         self.worker_done.emit()
@@ -84,20 +90,26 @@ class Ns_Worker_LCA_Generate_Table(Ns_Worker):
         }
         lca_instance = Ns_LCA(**init_kwargs)
         model: Ns_StandardItemModel = self.main.model_lca
-        has_trailing_rows: bool = True
+        # Headers never change after setup; avoid a Qt round-trip per cell
+        item_names = tuple(model.horizontalHeaderItem(colno).text() for colno in range(1, model.columnCount()))
         for rowno, (file_name, file_path) in enumerate(zip(file_names, file_paths, strict=False)):
             counter: Ns_LCA_Counter = lca_instance.run_on_file_or_subfiles(file_path)
 
-            if has_trailing_rows:
-                has_trailing_rows = model.removeRows(rowno, model.rowCount() - rowno)
+            # Clear leftover rows from a previous run only while there are
+            # any; once the model has caught up this is a no-op check
+            if rowno < model.rowCount():
+                model.removeRows(rowno, model.rowCount() - rowno)
 
-            model.set_item_left_shifted(rowno, 0, file_name)
-            for colno in range(1, model.columnCount()):
-                item_name = model.horizontalHeaderItem(colno).text()
+            # Build the whole row first and install it with a single insertRow
+            # call, instead of one setItem round-trip per cell
+            row_items = [model.make_item_left_shifted(file_name)]
+            for item_name in item_names:
                 value = counter.get_value(item_name)
-                item = model.set_item_right_shifted(rowno, colno, value)
+                item = model.make_item_right_shifted(value)
                 if matches := counter.get_matches(item_name):
                     item.setData(matches, Qt.ItemDataRole.UserRole)
+                row_items.append(item)
+            model.insertRow(rowno, row_items)
             model.row_added.emit()
 
         self.worker_done.emit()
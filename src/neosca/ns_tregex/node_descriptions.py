@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import functools
 import re
 from collections.abc import Generator, Iterable, Iterator
 from typing import NamedTuple
@@ -7,6 +8,31 @@ from typing import NamedTuple
 from neosca.ns_tregex.tree import Tree
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_tregex_regex(value: str) -> re.Pattern:
+    # Convert regex to standard python regex
+    flag = ""
+    current_flag = value[-1]
+    while current_flag != "/":
+        # Seems that only (?m) and (?x) are useful for node describing:
+        #  re.ASCII      (?a)
+        #  re.IGNORECASE (?i)
+        #  re.LOCALE     (?L)
+        #  re.DOTALL     (?s)
+        #  re.MULTILINE  (?m)
+        #  re.VERBOSE    (?x)
+        if current_flag not in "xi":
+            raise ValueError(f"Error!! Unsupported regexp flag: {current_flag}")
+        flag += current_flag
+        value = value[:-1]
+        current_flag = value[-1]
+
+    value = value[1:-1]
+    if flag:
+        value = "(?" + "".join(set(flag)) + ")" + value
+    return re.compile(value)
+
+
 class Named_Nodes:
     def __init__(self, name: str | None, nodes: list[Tree] | None, strins_repr: str = "") -> None:
         self.name = name
@@ -128,28 +154,7 @@ class Node_Regex(Node_Op):
         if value is None:
             return is_negated
         else:
-            # Convert regex to standard python regex
-            flag = ""
-            current_flag = value[-1]
-            while current_flag != "/":
-                # Seems that only (?m) and (?x) are useful for node describing:
-                #  re.ASCII      (?a)
-                #  re.IGNORECASE (?i)
-                #  re.LOCALE     (?L)
-                #  re.DOTALL     (?s)
-                #  re.MULTILINE  (?m)
-                #  re.VERBOSE    (?x)
-                if current_flag not in "xi":
-                    raise ValueError(f"Error!! Unsupported regexp flag: {current_flag}")
-                flag += current_flag
-                value = value[:-1]
-                current_flag = value[-1]
-
-            value = value[1:-1]
-            if flag:
-                value = "(?" + "".join(set(flag)) + ")" + value
-
-            return (re.search(value, expect) is not None) != is_negated
+            return (_compile_tregex_regex(value).search(expect) is not None) != is_negated
 
 
 class Node_Any(Node_Op):
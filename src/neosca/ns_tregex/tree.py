@@ -330,6 +330,10 @@ class Tree:
 
     @classmethod
     def normalize(cls, text: str) -> str:
+        # Most labels contain no hyphen at all, let alone a bracket escape;
+        # skip both replace passes for them
+        if "-" not in text:
+            return text
         return text.replace("-LRB-", OPEN_PAREN).replace("-RRB-", CLOSE_PAREN)
 
     @classmethod
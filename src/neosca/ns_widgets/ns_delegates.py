@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
 
-from PyQt5.QtCore import QModelIndex, QPersistentModelIndex, QPointF, Qt
-from PyQt5.QtGui import QBrush, QColor, QPainter
+from PyQt5.QtCore import QEvent, QModelIndex, QPersistentModelIndex, QPointF, QRectF, QSize, Qt, QUrl
+from PyQt5.QtGui import QBrush, QColor, QDesktopServices, QPainter, QTextDocument
 from PyQt5.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
 
 from neosca.ns_settings.ns_settings import Ns_Settings
@@ -34,6 +34,64 @@ class Ns_StyledItemDelegate_Triangle(QStyledItemDelegate):
             painter.restore()
 
 
+class Ns_StyledItemDelegate_Html(QStyledItemDelegate):
+    """
+    Render rich text stored in DisplayRole and open anchors on click. Unlike
+    one setIndexWidget label per cell, painting costs only the visible rows
+    and no widget stays resident per cell.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # A single document is re-filled per call instead of allocated per cell
+        self.doc = QTextDocument()
+        self.doc.setDocumentMargin(2)
+
+    def _prepare_doc(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex):
+        alignment = index.data(Qt.ItemDataRole.TextAlignmentRole)
+        text_option = self.doc.defaultTextOption()
+        text_option.setAlignment(
+            Qt.AlignmentFlag(alignment) if alignment is not None else Qt.AlignmentFlag.AlignLeft
+        )
+        self.doc.setDefaultTextOption(text_option)
+        self.doc.setHtml(index.data(Qt.ItemDataRole.DisplayRole) or "")
+        self.doc.setTextWidth(option.rect.width())
+
+    def _y_offset(self, option: QStyleOptionViewItem) -> int:
+        # Center vertically the way a per-cell label would; _prepare_doc must
+        # have been called first
+        return max(0, (option.rect.height() - round(self.doc.size().height())) // 2)
+
+    # Override
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ):
+        self._prepare_doc(option, index)
+        painter.save()
+        painter.translate(option.rect.x(), option.rect.y() + self._y_offset(option))
+        painter.setClipRect(QRectF(0, 0, option.rect.width(), option.rect.height()))
+        self.doc.drawContents(painter)
+        painter.restore()
+
+    # Override
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
+        self._prepare_doc(option, index)
+        return QSize(round(self.doc.idealWidth()), round(self.doc.size().height()))
+
+    # Override
+    def editorEvent(self, event, model, option, index) -> bool:  # type: ignore
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            self._prepare_doc(option, index)
+            # Undo the same translation paint() applies, or the hitboxes drift
+            # below the rendered links in tall rows
+            pos = QPointF(event.pos()) - QPointF(option.rect.topLeft()) - QPointF(0, self._y_offset(option))
+            anchor = self.doc.documentLayout().anchorAt(pos)
+            if anchor:
+                QDesktopServices.openUrl(QUrl(anchor))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
 class Ns_StyledItemDelegate_Matches(Ns_StyledItemDelegate_Triangle):
     def __init__(self, parent=None):
         super().__init__(parent)
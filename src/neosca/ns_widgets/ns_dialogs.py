@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 
+import functools
 import os
 import re
 import sys
+import time
 import traceback
 from collections.abc import Sequence
 from enum import Enum
 
 from PyQt5.QtCore import (
-    QElapsedTimer,
+    QAbstractTableModel,
     QModelIndex,
     QSize,
     QSortFilterProxyModel,
@@ -16,8 +18,10 @@ from PyQt5.QtCore import (
     QTime,
     QTimer,
     pyqtSignal,
+    pyqtSlot,
 )
 from PyQt5.QtGui import (
+    QGuiApplication,
     QIcon,
     QTextBlockFormat,
     QTextCursor,
@@ -28,6 +32,7 @@ from PyQt5.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QGridLayout,
+    QHBoxLayout,
     QLabel,
     QMessageBox,
     QPushButton,
@@ -35,13 +40,11 @@ from PyQt5.QtWidgets import (
     QTextBrowser,
 )
 
-from neosca import ACKS_PATH, CACHE_DIR, CITING_PATH, ICON_PATH
+from neosca import ACKS_PATH, ACKS_PREBUILT_PATH, CACHE_DIR, CITING_PATH, ICON_PATH
 from neosca.ns_about import __email__, __title__, __version__, __year__
 from neosca.ns_io import Ns_Cache, Ns_IO
 from neosca.ns_settings.ns_settings import Ns_Settings
 from neosca.ns_widgets.ns_labels import (
-    Ns_Label_Html,
-    Ns_Label_Html_Centered,
     Ns_Label_Html_VBottom,
     Ns_Label_Html_VTop,
     Ns_Label_Html_WordWrapped,
@@ -50,6 +53,27 @@ from neosca.ns_widgets.ns_labels import (
 from neosca.ns_widgets.ns_tables import Ns_SortFilterProxyModel, Ns_StandardItemModel, Ns_TableView
 from neosca.ns_widgets.ns_widgets import Ns_MessageBox_Question, Ns_TextEdit_ReadOnly
 
+# Version and platform are fixed for the process lifetime, so the error
+# dialog's metadata block can be built once at import
+_err_metadata = "\n".join(
+    ("", "Metadata:", f"  {__title__} version: {__version__}", f"  Platform: {sys.platform}")
+)
+
+
+# time_format is practically always one of a couple of constants, so the
+# placeholder substitution (e.g. "h:mm:ss" -> "0:00:00") only needs to run
+# once per distinct format, not once per dialog
+@functools.lru_cache(maxsize=8)
+def _zero_time_placeholder(time_format: str) -> str:
+    return re.sub(r"[^:]", "0", time_format)
+
+
+# Every dialog shows the same window icon; decode the .ico once and share
+# the QIcon instead of re-reading it per dialog
+@functools.lru_cache(maxsize=1)
+def _get_window_icon() -> QIcon:
+    return QIcon(str(ICON_PATH))
+
 
 class Ns_Dialog_Meta(type(QDialog)):  # type: ignore
     def __call__(self, *args, **kwargs):
@@ -83,11 +107,14 @@ class Ns_Dialog(QDialog, metaclass=Ns_Dialog_Meta):
         self.resizable = resizable
 
         self.setWindowTitle(title)
-        self.setWindowIcon(QIcon(str(ICON_PATH)))
+        self.setWindowIcon(_get_window_icon())
 
         self.layout_content = QGridLayout()
-        self.layout_button = QGridLayout()
-        self.layout_button.setColumnStretch(1, 1)
+        # Buttons always sit in one row, so a box layout is enough; the
+        # stretch separates the left- and right-aligned groups
+        self.layout_button = QHBoxLayout()
+        self.layout_button.addStretch(1)
+        self._count_left_button_groups = 0
 
         self.grid_layout = QGridLayout()
         self.grid_layout.addLayout(self.layout_content, 0, 0)
@@ -121,10 +148,15 @@ class Ns_Dialog(QDialog, metaclass=Ns_Dialog_Meta):
         self.layout_content.addWidget(*args, **kwargs)
 
     def addButtons(self, *buttons, alignment: ButtonAlignmentFlag) -> None:
-        layout = QGridLayout()
-        for colno, button in enumerate(buttons):
-            layout.addWidget(button, 0, colno)
-        self.layout_button.addLayout(layout, 0, alignment.value)
+        layout = QHBoxLayout()
+        for button in buttons:
+            layout.addWidget(button)
+        if alignment is Ns_Dialog.ButtonAlignmentFlag.AlignLeft:
+            # Before the central stretch
+            self.layout_button.insertLayout(self._count_left_button_groups, layout)
+            self._count_left_button_groups += 1
+        else:
+            self.layout_button.addLayout(layout)
 
     def setColumnStretch(self, column: int, strech: int) -> None:
         self.layout_content.setColumnStretch(column, strech)
@@ -143,8 +175,6 @@ class Ns_Dialog(QDialog, metaclass=Ns_Dialog_Meta):
 
 class Ns_Dialog_Processing_With_Elapsed_Time(Ns_Dialog):
     started = pyqtSignal()
-    # Use this to get the place holder, e.g. 0:00:00
-    time_format_re = re.compile(r"[^:]")
 
     def __init__(
         self,
@@ -158,42 +188,94 @@ class Ns_Dialog_Processing_With_Elapsed_Time(Ns_Dialog):
     ) -> None:
         super().__init__(main, title=title, width=width, height=height, resizable=False, **kwargs)
         self.time_format = time_format
-        self.interval = interval
-        self.elapsedtimer = QElapsedTimer()
-        self.timer = QTimer()
+        # Align the tick to the finest unit the format can display; updating
+        # once per second is wasted work when the format omits seconds
+        if "s" in time_format:
+            min_interval = 1_000
+        elif "m" in time_format:
+            min_interval = 60_000
+        else:
+            min_interval = 3_600_000
+        self.interval = max(interval, min_interval)
+        # A single native timer (startTimer/timerEvent) replaces the
+        # QTimer+QElapsedTimer pair: no signal hop per tick, and elapsed time
+        # is computed from a monotonic baseline
+        self._timer_id: int = 0
+        self._start_monotonic: float | None = None
 
         # TODO: this label should be exposed
         self.label_status = QLabel("Processing...")
-        self.text_time_elapsed_zero = f"Elapsed time: {self.time_format_re.sub('0', time_format)}"
+        self.text_time_elapsed_zero = _zero_time_placeholder(time_format)
+        # The prefix never changes, so keep it in its own label and only
+        # relayout the digits on each tick
+        self.label_time_elapsed_prefix = QLabel("Elapsed time:")
         self.label_time_elapsed = QLabel(self.text_time_elapsed_zero)
+        self._last_time_elapsed_text = self.text_time_elapsed_zero
         self.label_please_wait = Ns_Label_WordWrapped("The process can take some time, please be patient.")
 
+        layout_time_elapsed = QHBoxLayout()
+        layout_time_elapsed.addWidget(self.label_time_elapsed_prefix)
+        layout_time_elapsed.addWidget(self.label_time_elapsed)
+
         self.addWidget(self.label_status, 0, 0)
-        self.addWidget(self.label_time_elapsed, 0, 1, alignment=Qt.AlignmentFlag.AlignRight)
+        self.layout_content.addLayout(layout_time_elapsed, 0, 1, alignment=Qt.AlignmentFlag.AlignRight)
         self.addWidget(self.label_please_wait, 1, 0, 1, 2)
 
         self.setWindowFlags(self.windowFlags() | Qt.WindowType.FramelessWindowHint)
 
         # Bind
-        self.timer.timeout.connect(self.update_time_elapsed)
-        self.started.connect(self.elapsedtimer.start)
-        # If the timer is already running, it will be stopped and restarted.
-        self.started.connect(lambda: self.timer.start(self.interval))
+        self.started.connect(self.on_started)
         self.accepted.connect(self.update_statusbar)
         # Either 'accepted' or 'rejected', although 'rejected' is disabled (see rejected below)
         self.finished.connect(self.reset_time_elapsed)
-        self.finished.connect(self.timer.stop)
+        self.finished.connect(self.stop_timer)
+
+    @pyqtSlot()
+    def on_started(self) -> None:
+        self._start_monotonic = time.monotonic()
+        self.start_timer()
+
+    def start_timer(self) -> None:
+        if not self._timer_id:
+            self._timer_id = self.startTimer(self.interval)
+
+    @pyqtSlot()
+    def stop_timer(self) -> None:
+        if self._timer_id:
+            self.killTimer(self._timer_id)
+            self._timer_id = 0
+
+    def elapsed(self) -> int:
+        """Milliseconds since the current run started."""
+        assert self._start_monotonic is not None
+        return round((time.monotonic() - self._start_monotonic) * 1000)
+
+    # Override
+    def timerEvent(self, event) -> None:
+        if event.timerId() == self._timer_id:
+            self.update_time_elapsed()
+        else:
+            super().timerEvent(event)
 
+    @pyqtSlot()
     def reset_time_elapsed(self) -> None:
+        self._last_time_elapsed_text = self.text_time_elapsed_zero
         self.label_time_elapsed.setText(self.text_time_elapsed_zero)
 
+    @pyqtSlot()
     def update_time_elapsed(self) -> None:
-        time_elapsed: int = self.elapsedtimer.elapsed()
+        time_elapsed: int = self.elapsed()
         qtime: QTime = QTime.fromMSecsSinceStartOfDay(time_elapsed)
-        self.label_time_elapsed.setText(f"Elapsed time: {qtime.toString(self.time_format)}")
-
+        text = qtime.toString(self.time_format)
+        # Timer drift can make consecutive ticks format identically; skip the
+        # label relayout when the displayed text would not change
+        if text != self._last_time_elapsed_text:
+            self._last_time_elapsed_text = text
+            self.label_time_elapsed.setText(text)
+
+    @pyqtSlot()
     def update_statusbar(self) -> None:
-        time_elapsed: int = self.elapsedtimer.elapsed()
+        time_elapsed: int = self.elapsed()
         qtime: QTime = QTime.fromMSecsSinceStartOfDay(time_elapsed)
         formatted_time_elapsed = "".join(
             (
@@ -208,6 +290,20 @@ class Ns_Dialog_Processing_With_Elapsed_Time(Ns_Dialog):
     def reject(self) -> None:
         pass
 
+    # Override
+    def hideEvent(self, event) -> None:
+        # No point formatting time for an invisible label
+        self.stop_timer()
+        super().hideEvent(event)
+
+    # Override
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        # Resume ticking if a run is still in progress; the monotonic
+        # baseline keeps counting while hidden so the display stays continuous
+        if self._start_monotonic is not None:
+            self.start_timer()
+
     # Override
     def show(self) -> None:
         self.started.emit()
@@ -233,6 +329,7 @@ class Ns_Dialog_TextEdit(Ns_Dialog):
         self.fmt_textedit = QTextBlockFormat()
         self.fmt_textedit.setLeftMargin(indentation)
         self.fmt_textedit.setTextIndent(-indentation)
+        self.is_textedit_added = False
 
         button_copy = QPushButton("Copy")
         button_copy.clicked.connect(self.copy)
@@ -244,31 +341,49 @@ class Ns_Dialog_TextEdit(Ns_Dialog):
         self.addButtons(buttonbox_close, alignment=Ns_Dialog.ButtonAlignmentFlag.AlignRight)
 
     def setText(self, text: str) -> None:
-        self.textedit.setText(text)
+        # Replace the content and re-apply the hanging indent through one
+        # cursor edit block, so the document relays out once instead of once
+        # per step
         cursor = QTextCursor(self.textedit.document())
+        cursor.beginEditBlock()
+        cursor.select(QTextCursor.SelectionType.Document)
+        # Keep the rich-text auto-detection that QTextEdit.setText performs:
+        # the citation entries are HTML
+        if Qt.mightBeRichText(text):
+            cursor.insertHtml(text)
+        else:
+            cursor.insertText(text)
         cursor.select(QTextCursor.SelectionType.Document)
         cursor.mergeBlockFormat(self.fmt_textedit)
+        cursor.endEditBlock()
 
+    @pyqtSlot()
     def copy(self) -> None:
-        self.textedit.selectAll()
-        self.textedit.copy()
+        # Push the text straight to the clipboard; selectAll+copy would
+        # mutate the visible selection and repaint the whole document
+        QGuiApplication.clipboard().setText(self.textedit.toPlainText())
+
+    def add_textedit_lastly(self) -> None:
+        # Add self.textedit lastly to allow users add custom widgets above;
+        # only once, or a re-shown dialog re-inserts it and grows the layout
+        if self.is_textedit_added:
+            return
+        self.is_textedit_added = True
+        self.addWidget(self.textedit, self.rowCount(), 0, 1, self.columnCount())
 
     # Override
     def show(self) -> None:
-        # Add self.textedit lastly to allow adding custom widgets above
-        self.addWidget(self.textedit, self.rowCount(), 0, 1, self.columnCount())
+        self.add_textedit_lastly()
         return super().show()
 
     # Override
     def open(self) -> None:
-        # Add self.textedit lastly to allow users add custom widgets above
-        self.addWidget(self.textedit, self.rowCount(), 0, 1, self.columnCount())
+        self.add_textedit_lastly()
         return super().open()
 
     # Override
     def exec(self) -> int:
-        # Add self.textedit lastly to allow users add custom widgets above
-        self.addWidget(self.textedit, self.rowCount(), 0, 1, self.columnCount())
+        self.add_textedit_lastly()
         return super().exec()
 
 
@@ -292,35 +407,68 @@ class Ns_Dialog_TextEdit_Matches(Ns_Dialog_TextEdit):
 
 
 class Ns_Dialog_TextEdit_Citing(Ns_Dialog_TextEdit):
+    _cached_style_citation_mapping: dict | None = None
+
+    @classmethod
+    def _get_style_citation_mapping(cls) -> dict:
+        # The citation file ships with the program and never changes during a
+        # session, so parse it on the first open only
+        if cls._cached_style_citation_mapping is None:
+            cls._cached_style_citation_mapping = Ns_IO.load_json(CITING_PATH)
+        return cls._cached_style_citation_mapping
+
+    # Scrolling the combobox fires currentTextChanged per intermediate style;
+    # only the one the user settles on is worth a document rebuild
+    debounce_interval: int = 50
+
     def __init__(self, main, **kwargs):
         super().__init__(main, title="Citing", width=600, height=600, **kwargs)
-        self.style_citation_mapping = Ns_IO.load_json(CITING_PATH)
+        self.style_citation_mapping = self._get_style_citation_mapping()
+        self._pending_style: str | None = None
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.timeout.connect(self._apply_pending_style)
         self.label_citing = Ns_Label_WordWrapped(
             f"If you use {__title__} in your research, please cite as follows."
         )
         self.setText(next(iter(self.style_citation_mapping.values())))
         self.label_choose_citation_style = QLabel("Choose citation style: ")
         self.combobox_choose_citation_style = QComboBox()
-        self.combobox_choose_citation_style.addItems(tuple(self.style_citation_mapping.keys()))
-        self.combobox_choose_citation_style.currentTextChanged.connect(
-            lambda key: self.setText(self.style_citation_mapping[key])
+        # Size to contents once on first show instead of refitting geometry
+        # whenever the item model changes
+        self.combobox_choose_citation_style.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToContentsOnFirstShow
         )
+        # Populate in one batch with signals blocked, and only then wire
+        # currentTextChanged, so the initial insertion cannot fire a spurious
+        # first-item update
+        self.combobox_choose_citation_style.blockSignals(True)
+        self.combobox_choose_citation_style.insertItems(0, list(self.style_citation_mapping))
+        self.combobox_choose_citation_style.blockSignals(False)
+        self.combobox_choose_citation_style.currentTextChanged.connect(self.on_citation_style_changed)
 
         self.addWidget(self.label_citing, 0, 0, 1, 2)
         self.addWidget(self.label_choose_citation_style, 1, 0)
         self.addWidget(self.combobox_choose_citation_style, 1, 1)
         self.setColumnStretch(1, 1)
 
+    @pyqtSlot(str)
+    def on_citation_style_changed(self, style: str) -> None:
+        self._pending_style = style
+        self._debounce_timer.start(self.debounce_interval)
+
+    @pyqtSlot()
+    def _apply_pending_style(self) -> None:
+        if self._pending_style is not None:
+            self.setText(self.style_citation_mapping[self._pending_style])
+            self._pending_style = None
+
 
 class Ns_Dialog_TextEdit_Err(Ns_Dialog_TextEdit):
     def __init__(self, main, ex: Exception, **kwargs) -> None:
         super().__init__(main, title="Error", width=800, height=600, **kwargs)
-        # https://stackoverflow.com/a/35712784/20732031
-        trace_back = "".join(traceback.TracebackException.from_exception(ex).format())
-        meta_data = "\n".join(
-            ("", "Metadata:", f"  {__title__} version: {__version__}", f"  Platform: {sys.platform}")
-        )
-        self.setText(trace_back + meta_data)
+        trace_back = "".join(traceback.format_exception(ex))
+        self.setText(trace_back + _err_metadata)
 
         self.label_desc = Ns_Label_Html_WordWrapped(
             f"An error occurred. Please send the following error messages to <a href='mailto:{__email__}'>{__email__}</a> to contact the author for support."
@@ -353,7 +501,9 @@ class Ns_Dialog_Table(Ns_Dialog):
         # Bottom left buttons
         if export_filename is not None:
             self.button_export_table = QPushButton("Export table...")
-            self.button_export_table.clicked.connect(lambda: self.tableview.export_table(export_filename))
+            self.button_export_table.clicked.connect(
+                functools.partial(self.tableview.export_table, export_filename)
+            )
             self.addButtons(self.button_export_table, alignment=Ns_Dialog.ButtonAlignmentFlag.AlignLeft)
 
         # Bottom right buttons
@@ -363,31 +513,104 @@ class Ns_Dialog_Table(Ns_Dialog):
             self.addButtons(buttonbox_close, alignment=self.ButtonAlignmentFlag.AlignRight)
 
 
+class Ns_Acknowledgments_Model(QAbstractTableModel):
+    data_cleared = pyqtSignal()
+    row_added = pyqtSignal()
+
+    hor_labels: tuple[str, ...] = ("Name", "Version", "Authors", "License")
+    # Columns rendered centered by the delegate
+    centered_colnos: tuple[int, ...] = (1, 3)
+
+    def __init__(self, parent, rows: list[tuple[str, str, str, str]]) -> None:
+        super().__init__(parent)
+        # One HTML tuple per row; no per-cell item objects, cells are served
+        # on demand from data()
+        self.rows = rows
+
+    @staticmethod
+    def rows_frm_projects(projects: list[dict]) -> list[tuple[str, str, str, str]]:
+        # Runtime fallback; utils/ns_generate_acks.py bakes the same HTML
+        # into acks_prebuilt.json at build time
+        return [
+            (
+                f"<a href='{project['homepage']}'>{project['name']}</a>",
+                project["version"],
+                project["authors"],
+                f"<a href='{project['license_file']}'>{project['license']}</a>"
+                if project["license_file"]
+                else f"{project['license']}",
+            )
+            for project in projects
+        ]
+
+    # Override
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        return len(self.rows)
+
+    # Override
+    def columnCount(self, parent: QModelIndex | None = None) -> int:
+        return len(self.hor_labels)
+
+    # Override
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.hor_labels[section]
+        return None
+
+    # Override
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.rows[index.row()][index.column()]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() in self.centered_colnos:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def is_empty(self) -> bool:
+        return not self.rows
+
+
 class Ns_Dialog_Table_Acknowledgments(Ns_Dialog_Table):
+    _cached_ack_data: tuple[str, list[tuple[str, str, str, str]]] | None = None
+
+    @classmethod
+    def _get_ack_data(cls) -> tuple[str, list[tuple[str, str, str, str]]]:
+        # Like the citation mapping, the acknowledgments data is immutable
+        # within a session. Prefer the HTML pre-formatted at build time;
+        # fall back to formatting acks.json when the sidecar is absent
+        if cls._cached_ack_data is None:
+            if os.path.exists(ACKS_PREBUILT_PATH):
+                prebuilt = Ns_IO.load_json(ACKS_PREBUILT_PATH)
+                cls._cached_ack_data = (
+                    prebuilt["acknowledgment"],
+                    [tuple(row) for row in prebuilt["rows"]],
+                )
+            else:
+                ack_data = Ns_IO.load_json(ACKS_PATH)
+                cls._cached_ack_data = (
+                    ack_data["acknowledgment"],
+                    Ns_Acknowledgments_Model.rows_frm_projects(ack_data["projects"]),
+                )
+        return cls._cached_ack_data
+
     def __init__(self, main) -> None:
-        ack_data = Ns_IO.load_json(ACKS_PATH)
-        acknowledgment = ack_data["acknowledgment"]
-        projects = ack_data["projects"]
-        model_ack = Ns_StandardItemModel(
-            main, hor_labels=("Name", "Version", "Authors", "License"), show_empty_row=False
-        )
-        model_ack.setRowCount(len(projects))
-        tableview_ack = Ns_TableView(main, model=model_ack)
-        for rowno, project in enumerate(projects):
-            cols = (
-                Ns_Label_Html(f"<a href='{project['homepage']}'>{project['name']}</a>"),
-                Ns_Label_Html_Centered(project["version"]),
-                Ns_Label_Html(project["authors"]),
-                Ns_Label_Html_Centered(
-                    f"<a href='{project['license_file']}'>{project['license']}</a>"
-                    if project["license_file"]
-                    else f"{project['license']}"
-                ),
-            )
-            for colno, label in enumerate(cols):
-                tableview_ack.setIndexWidget(model_ack.index(rowno, colno), label)
+        # Local import: ns_delegates imports this module for the matches dialog
+        from neosca.ns_widgets.ns_delegates import Ns_StyledItemDelegate_Html
+
+        acknowledgment, rows = self._get_ack_data()
+        self.model_ack = Ns_Acknowledgments_Model(main, rows)
+        self.tableview_ack = Ns_TableView(main, model=self.model_ack)
+        # Cells hold HTML strings rendered by the delegate; a resident label
+        # widget per cell would cost a full widget even for invisible rows
+        self.tableview_ack.setItemDelegate(Ns_StyledItemDelegate_Html(self.tableview_ack))
         super().__init__(
-            main, title="Acknowledgments", tableview=tableview_ack, html=acknowledgment, width=600, height=600
+            main,
+            title="Acknowledgments",
+            tableview=self.tableview_ack,
+            html=acknowledgment,
+            width=600,
+            height=600,
         )
 
 
@@ -408,7 +631,7 @@ class Ns_Dialog_About(Ns_Dialog):
         """
         )
         label_icon = QLabel()
-        label_icon.setPixmap(QIcon(str(ICON_PATH)).pixmap(QSize(64, 64)))
+        label_icon.setPixmap(_get_window_icon().pixmap(QSize(64, 64)))
         label_name = Ns_Label_Html_VTop(f"<h1>{__title__}</h1>")
         label_version = Ns_Label_Html_VBottom(f"v{__version__}")
         textbrowser = QTextBrowser()
@@ -469,16 +692,19 @@ class Ns_Dialog_Table_Cache(Ns_Dialog_Table):
         self.button_delete_selected.setEnabled(False)
         self.tableview_cache.selectionModel().selectionChanged.connect(self.on_selection_changed)
 
+    @pyqtSlot()
     def on_selection_changed(self) -> None:
         if self.tableview_cache.selectionModel().selectedRows(column=0):
             self.button_delete_selected.setEnabled(True)
         else:
             self.button_delete_selected.setEnabled(False)
 
+    @pyqtSlot()
     def on_delete_all(self) -> None:
         cache_paths = tuple(self.model_cache.yield_column(0, Qt.ItemDataRole.UserRole))
         self.delete_cache(cache_paths)
 
+    @pyqtSlot()
     def on_delete_selected(self) -> None:
         indexes: list[QModelIndex] = self.tableview_cache.selectionModel().selectedRows(column=0)
         cache_paths = tuple(index.data(Qt.ItemDataRole.UserRole) for index in indexes)
@@ -506,6 +732,9 @@ class Ns_Dialog_Table_Cache(Ns_Dialog_Table):
         for cache_path in cache_paths:
             try:
                 os.remove(cache_path)
+                forest_path = Ns_Cache.get_forest_path(cache_path)
+                if os.path.exists(forest_path):
+                    os.remove(forest_path)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Error deleting file: {e}")
 
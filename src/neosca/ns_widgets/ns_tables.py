@@ -4,7 +4,14 @@ import os.path as os_path
 from collections.abc import Generator, Iterable, Sequence
 from typing import Any, Literal
 
-from PyQt5.QtCore import QModelIndex, QPersistentModelIndex, QSortFilterProxyModel, Qt, pyqtSignal
+from PyQt5.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    pyqtSignal,
+)
 from PyQt5.QtGui import (
     QStandardItem,
     QStandardItemModel,
@@ -60,10 +67,17 @@ class Ns_StandardItemModel(QStandardItemModel):
         self.show_empty_row = show_empty_row
 
         self.has_been_exported: bool = False
-        self.row_added.connect(lambda: self.set_has_been_exported(False))
-        self.data_exported.connect(lambda: self.set_has_been_exported(True))
+        self.row_added.connect(self._on_row_added)
+        self.data_exported.connect(self._on_data_exported)
 
-    def set_item_left_shifted(self, rowno: int, colno: int, value: QStandardItem | str) -> QStandardItem:
+    def _on_row_added(self) -> None:
+        self.set_has_been_exported(False)
+
+    def _on_data_exported(self) -> None:
+        self.set_has_been_exported(True)
+
+    @staticmethod
+    def make_item_left_shifted(value: QStandardItem | str) -> QStandardItem:
         if isinstance(value, QStandardItem):
             item = value
         elif isinstance(value, str):
@@ -73,6 +87,10 @@ class Ns_StandardItemModel(QStandardItemModel):
         else:
             assert False, f"Invalid value type: {type(value)}"
         item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        return item
+
+    def set_item_left_shifted(self, rowno: int, colno: int, value: QStandardItem | str) -> QStandardItem:
+        item = self.make_item_left_shifted(value)
         self.setItem(rowno, colno, item)
         return item
 
@@ -80,9 +98,8 @@ class Ns_StandardItemModel(QStandardItemModel):
         for colno, value in enumerate(values, start=start):
             self.set_item_left_shifted(rowno, colno, value)
 
-    def set_item_right_shifted(
-        self, rowno: int, colno: int, value: QStandardItem | str | int | float
-    ) -> QStandardItem:
+    @staticmethod
+    def make_item_right_shifted(value: QStandardItem | str | int | float) -> QStandardItem:
         if isinstance(value, QStandardItem):
             item = value
         elif isinstance(value, (str, int, float)):
@@ -92,6 +109,12 @@ class Ns_StandardItemModel(QStandardItemModel):
         else:
             assert False, f"Invalid value type: {type(value)}"
         item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return item
+
+    def set_item_right_shifted(
+        self, rowno: int, colno: int, value: QStandardItem | str | int | float
+    ) -> QStandardItem:
+        item = self.make_item_right_shifted(value)
         self.setItem(rowno, colno, item)
         return item
 
@@ -177,17 +200,30 @@ class Ns_StandardItemModel(QStandardItemModel):
 class Ns_StandardItemModel_File(Ns_StandardItemModel):
     def __init__(self, main) -> None:
         super().__init__(main, hor_labels=("Name", "Path"), show_empty_row=True)
-        self.data_cleared.connect(lambda: self.main.enable_button_generate_table(False))
-        self.row_added.connect(lambda: self.main.enable_button_generate_table(True))
+        self.data_cleared.connect(self._on_data_cleared)
+
+    def _on_data_cleared(self) -> None:
+        self.main.enable_button_generate_table(False)
+
+    # Override: one slot both resets the export flag and updates the buttons,
+    # so each row_added emission dispatches to a single receiver
+    def _on_row_added(self) -> None:
+        super()._on_row_added()
+        self.main.enable_button_generate_table(True)
 
     def user_or_display_data(self, index_or_rowno: QModelIndex | int, colno: int | None = None) -> Any:
+        # Fetch the QStandardItem once and read both roles off it, instead of
+        # dispatching two index.data() lookups through the model
         if isinstance(index_or_rowno, QModelIndex):
-            user_data = index_or_rowno.data(Qt.ItemDataRole.UserRole)
-            return user_data if user_data else index_or_rowno.data(Qt.ItemDataRole.DisplayRole)
+            item = self.itemFromIndex(index_or_rowno)
         elif colno is not None:
-            return self.user_or_display_data(self.index(index_or_rowno, colno))
+            item = self.item(index_or_rowno, colno)
         else:
             assert False, f"Invalid index_or_rowno type: {type(index_or_rowno)}"
+        if item is None:
+            return None
+        user_data = item.data(Qt.ItemDataRole.UserRole)
+        return user_data if user_data else item.data(Qt.ItemDataRole.DisplayRole)
 
     def _yield_flat_file_column(self, colno: int) -> Generator[str, None, None]:
         for rowno in range(self.rowCount()):
@@ -254,7 +290,7 @@ class Ns_TableView(QTableView):
     def __init__(
         self,
         main,
-        model: Ns_StandardItemModel | Ns_SortFilterProxyModel,
+        model: QAbstractTableModel | Ns_StandardItemModel | Ns_SortFilterProxyModel,
         has_hor_header: bool = True,
         has_ver_header: bool = False,
         **kwargs,
@@ -262,13 +298,13 @@ class Ns_TableView(QTableView):
         super().__init__(main, **kwargs)
         self.main = main
         self.setModel(model)
-        if isinstance(model, Ns_StandardItemModel):
-            self.source_model = model
-        elif isinstance(model, Ns_SortFilterProxyModel):
+        if isinstance(model, Ns_SortFilterProxyModel):
             self.source_model = model.sourceModel()
             self.setSortingEnabled(True)
         else:
-            assert False, f"Invalid model type: {model.__class__.__name__}"
+            # Any model exposing the Ns_StandardItemModel signal surface
+            # (data_cleared, row_added, is_empty) works as a source model
+            self.source_model = model
         self.source_model.data_cleared.connect(self.on_data_cleared)
         self.source_model.row_added.connect(self.on_row_added)
         self.has_hor_header = has_hor_header
@@ -644,7 +680,7 @@ class Ns_TableView(QTableView):
                 # Header font
                 for ws in workbook.worksheets:
                     for cell in ws[get_column_letter(1)]:
-                        cell.font = Font(size=Ns_Settings.value("Appearance/font-size", type=int))
+                        cell.font = Font(size=font_size)
 
                 # Freeze panes
                 for ws in workbook.worksheets:
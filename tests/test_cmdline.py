@@ -2,12 +2,14 @@ import logging
 import os
 import os.path as os_path
 import re
+import zipfile
 
 from neosca.ns_main_cli import Ns_Main_Cli
 
 from .cmdline_tmpl import CmdlineTmpl
 
 cli_text = "This is a test."
+cli_forest = "(ROOT (S (NP (PRP I)) (VP (VBP like) (NP (PRP it)))))"
 
 
 class TestCommandLine(CmdlineTmpl):
@@ -129,6 +131,46 @@ class TestCommandLine(CmdlineTmpl):
             self.assertEqual(self.ui.options.oformat_freq, "json")
             self.assertEqual(self.ui.odir_matched, "result_matches")
 
+    def test_zip_matches(self):
+        args = ["nsca", "sca", "--text", cli_text, "--save-matches"]
+        self.ui.parse_args(args)
+        self.assertFalse(self.ui.options.is_zip_matches)
+
+        args = ["nsca", "sca", "--text", cli_text, "--save-matches", "--zip-matches"]
+        self.ui.parse_args(args)
+        self.assertTrue(self.ui.options.is_zip_matches)
+
+        output_files = ["neosca_sca_results.csv", "neosca_sca_matches"]
+        self.template(
+            ["python", "-m", "neosca", "sca", "--no-parse", "sample.txt", "--save-matches", "--zip-matches"],
+            text=cli_forest,
+            expected_output_file=output_files,
+            cleanup=False,
+        )
+        try:
+            with zipfile.ZipFile(os_path.join("neosca_sca_matches", "sample.zip")) as zf:
+                member_names = zf.namelist()
+                self.assertIn("sample-S.txt", member_names)
+                for member_name in member_names:
+                    self.assertRegex(member_name, r"^sample-.+\.txt$")
+                self.assertIn("I like it", zf.read("sample-S.txt").decode("utf-8"))
+        finally:
+            self.cleanup(output_file=output_files)
+
+    def test_jobs(self):
+        args = ["nsca", "sca", "--text", cli_text]
+        self.ui.parse_args(args)
+        self.assertEqual(self.ui.options.n_workers, 1)
+
+        args = ["nsca", "sca", "--text", cli_text, "--jobs", "2"]
+        self.ui.parse_args(args)
+        self.assertEqual(self.ui.options.n_workers, 2)
+
+        options = self.ui.args_parser.parse_args(["sca", "--text", cli_text, "--jobs", "0"])
+        success, err_msg = self.ui.parse_sca_args(options)
+        self.assertFalse(success)
+        self.assertIn("should be at least 1", err_msg)
+
     def test_list_fields(self):
         for subcommand, lineno in (("sca", 23), ("lca", 43)):
             result = self.template(
@@ -206,3 +206,37 @@ class TestStructureCounter(BaseTmpl):
             ("CP", 34),
         ):
             self.assertEqual(counter3.get_value(s_name), value)
+
+    def test_merge_counts(self):
+        forest1 = "(ROOT (S (NP (PRP I)) (VP (VBP like) (NP (PRP it)))))"
+        forest2 = "(ROOT (S (VP (VB Run)))) (ROOT (NP (NN Fragment)))"
+        kwargs = {
+            "selected_measures": ["S", "VP", "VPS"],
+            "user_structure_defs": [
+                {"name": "VPS", "description": "verb phrases per sentence", "value_source": "VP / S"}
+            ],
+        }
+
+        child1 = Ns_SCA_Counter("sub1.txt", **kwargs)
+        child1.determine_all_values(forest1)
+        child2 = Ns_SCA_Counter("sub2.txt", **kwargs)
+        child2.determine_all_values(forest2)
+        self.assertEqual(child1.get_value("VPS"), 1)
+        self.assertEqual(child2.get_value("VPS"), 0.5)
+
+        parent = Ns_SCA_Counter(**kwargs)
+        parent.merge_counts(child1)
+        parent.merge_counts(child2)
+        self.assertEqual(parent.ifile, "sub1.txt+sub2.txt")
+        # Tregex-backed counts and matches accumulate across merges
+        self.assertEqual(parent.get_value("S"), 3)
+        self.assertEqual(len(parent.get_matches("S")), 3)
+        # Measures defined by value_source are unset by the merge...
+        self.assertIsNone(parent.get_value("VP"))
+        self.assertIsNone(parent.get_value("VPS"))
+        # ...and recomputed from the accumulated counts, not averaged over
+        # subfiles; already-set counts like S must survive the empty forest
+        parent.determine_all_values()
+        self.assertEqual(parent.get_value("S"), 3)
+        self.assertEqual(parent.get_value("VP"), 2)
+        self.assertAlmostEqual(parent.get_value("VPS"), 2 / 3, places=4)
@@ -9,6 +9,19 @@ with open(acks_path, encoding="utf-8") as f:
     ack_data = json.load(f)
 acknowledgment, projects = ack_data.values()
 
+
+def format_project_html(project: dict) -> tuple[str, str, str, str]:
+    # Must stay in sync with Ns_Acknowledgments_Model's runtime fallback
+    return (
+        f"<a href='{project['homepage']}'>{project['name']}</a>",
+        project["version"],
+        project["authors"],
+        f"<a href='{project['license_file']}'>{project['license']}</a>"
+        if project["license_file"]
+        else f"{project['license']}",
+    )
+
+
 filepath = PKG_DIR / "ACKNOWLEDGMENTS.md"
 with open(filepath, "w", encoding="utf-8") as f:
     title = "# Acknowledgments\n\n"
@@ -17,13 +30,23 @@ with open(filepath, "w", encoding="utf-8") as f:
     f.writelines((title, f"{acknowledgment}\n\n", header, separator))
 
     for i, project in enumerate(projects, start=1):
+        _, version, authors, license_ = format_project_html(project)
         cols = (
             str(i),
             f"<a href='{project['homepage']}'>{project['name']}</a>",
-            project["version"],
-            project["authors"],
-            f"<a href='{project['license_file']}'>{project['license']}</a>"
-            if project["license_file"]
-            else f"{project['license']}",
+            version,
+            authors,
+            license_,
         )
         f.write(f"|{'|'.join(cols)}|\n")
+
+# The cell HTML is a pure function of acks.json, so bake it at build time and
+# let the acknowledgments dialog skip the formatting on the UI thread
+prebuilt_path = PKG_DIR / "src" / "neosca" / "ns_data" / "acks_prebuilt.json"
+with open(prebuilt_path, "w", encoding="utf-8") as f:
+    json.dump(
+        {"acknowledgment": acknowledgment, "rows": [format_project_html(project) for project in projects]},
+        f,
+        ensure_ascii=False,
+        indent=2,
+    )